@@ -20,11 +20,20 @@ tf.random.set_seed(1234)
 # %%
 import trieste
 
+FAILURE_CENTER = tf.constant([0.5, 0.4], dtype=tf.float64)
+FAILURE_SQUARED_RADIUS = tf.constant(0.3 ** 2, dtype=tf.float64)
+NAN = tf.constant(np.nan, dtype=tf.float64)
+
+
+@tf.function
 def masked_branin(x):
-    mask_nan = np.sqrt((x[:, 0] - 0.5) ** 2 + (x[:, 1] - .4) ** 2) < 0.3
-    y = np.array(trieste.objectives.branin(x))
-    y[mask_nan] = np.nan
-    return tf.convert_to_tensor(y.reshape(-1, 1), x.dtype)
+    center, squared_radius, nan = (
+        tf.cast(c, x.dtype) for c in (FAILURE_CENTER, FAILURE_SQUARED_RADIUS, NAN)
+    )
+    squared_distance = tf.reduce_sum(tf.square(x - center), axis=1)
+    y = tf.squeeze(trieste.objectives.branin(x), -1)
+    y = tf.where(squared_distance < squared_radius, nan, y)
+    return tf.reshape(y, [-1, 1])
 
 # %% [markdown]
 # As mentioned, we'll search over the hypercube $[0, 1]^2$ ...
@@ -36,13 +45,19 @@ search_space = Box([0, 0], [1, 1])
 
 # %% [markdown]
 # ... where the `masked_branin` now looks as follows. The white area in the centre shows the failure
-# region.
+# region. Single precision is plenty for plotting, so we evaluate the dense plotting grids in
+# `float32`, while the observations used to train the models stay in `float64`.
 
 # %%
 from util.plotting_plotly import plot_function_plotly
 
+
+def masked_branin_float32(x):
+    return masked_branin(tf.cast(x, tf.float32))
+
+
 fig = plot_function_plotly(
-    masked_branin, search_space.lower, search_space.upper, grid_density=70
+    masked_branin_float32, search_space.lower, search_space.upper, grid_density=70
 )
 fig.update_layout(height=400, width=400)
 fig.show()
@@ -64,25 +79,33 @@ fig.show()
 OBJECTIVE = "OBJECTIVE"
 FAILURE = "FAILURE"
 
-def observer(x):
+@tf.function(input_signature=[tf.TensorSpec([None, 2], tf.float64)])
+def _evaluate(x):
     y = masked_branin(x)
-    mask = np.isfinite(y).reshape(-1)
+    finite = tf.reshape(tf.math.is_finite(y), [-1])
+    idx = tf.where(finite)[:, 0]
+    return tf.gather(x, idx), tf.gather(y, idx), tf.cast(finite, tf.float64)[:, None]
+
+
+def observer(x):
+    x_valid, y_valid, is_valid = _evaluate(x)
     return {
-        OBJECTIVE: trieste.data.Dataset(x[mask], y[mask]),
-        FAILURE: trieste.data.Dataset(x, tf.cast(np.isfinite(y), tf.float64))
+        OBJECTIVE: trieste.data.Dataset(x_valid, y_valid),
+        FAILURE: trieste.data.Dataset(x, is_valid)
     }
 
 # %% [markdown]
-# We can evaluate the observer at points sampled from the search space.
+# We can evaluate the observer at points from the search space. We use a (fixed) Sobol sequence for
+# these initial points, which covers the search space more evenly than uniform random sampling.
 
 # %%
 num_init_points = 15
-initial_data = observer(search_space.sample(num_init_points))
+initial_data = observer(search_space.sample_sobol(num_init_points, skip=1))
 
 # %% [markdown]
 # ## Build GPflow models
 #
-# We'll model the data on the objective with a regression model, and the data on which points failed with a classification model. The regression model will be a `GaussianProcessRegression` wrapping a GPflow `GPR`, and the classification model a `VariationalGaussianProcess` wrapping a GPflow `VGP` with Bernoulli likelihood.
+# We'll model the data on the objective with a regression model, and the data on which points failed with a classification model. The regression model will be a `GaussianProcessRegression` wrapping a GPflow `GPR`, and the classification model a `SparseVariational` wrapping a GPflow `SVGP` with Bernoulli likelihood. The number of points grows with every optimization step, so we use a small, fixed set of inducing points for the classification model, which keeps the cost of each training step constant.
 
 # %%
 import gpflow
@@ -96,14 +119,15 @@ def create_regression_model(data):
     return gpr
 
 
-def create_classification_model(data):
+def create_classification_model(data, num_inducing_points=8):
     kernel = gpflow.kernels.SquaredExponential(
         variance=100.0, lengthscales=[0.2, 0.2]
     )
     likelihood = gpflow.likelihoods.Bernoulli()
-    vgp = gpflow.models.VGP(data.astuple(), kernel, likelihood)
-    gpflow.set_trainable(vgp.kernel.variance, False)
-    return vgp
+    inducing_points = data.query_points[:num_inducing_points]
+    svgp = gpflow.models.SVGP(kernel, likelihood, inducing_points, num_data=len(data))
+    gpflow.set_trainable(svgp.kernel.variance, False)
+    return svgp
 
 
 regression_model = create_regression_model(initial_data[OBJECTIVE])
@@ -114,10 +138,7 @@ classification_model = create_classification_model(initial_data[FAILURE])
 #
 # We now specify how Trieste will use our GPflow models within the BO loop.
 #
-# For our `GPR` model, we will use a standard L-BFGS optimizer from Scipy, whereas we will optimze our `VGP` model using alternate Adam steps (to optimize kernel parameter) and NatGrad steps (to optimize variational parameters).
-
-# %% [markdown]
-# We'll train the GPR model with an L-BFGS-based optimizer, and the GPC model with the custom algorithm above.
+# For our `GPR` model, we will use a standard L-BFGS optimizer from Scipy, whereas we will optimize our `SVGP` model with Adam, over the full (small) dataset.
 
 # %%
 from trieste.models.gpflow import GPflowModelConfig
@@ -129,10 +150,7 @@ models: dict[str, trieste.models.ModelSpec] = {
     }),
     FAILURE: GPflowModelConfig(**{
         "model": classification_model,
-        "model_args": {
-            "use_natgrads": True,
-        },
-        "optimizer": tf.optimizers.Adam(1e-3),
+        "optimizer": tf.optimizers.Adam(5e-2),
         "optimizer_args": {
             "max_iter": 50,
         },       
@@ -147,15 +165,62 @@ models: dict[str, trieste.models.ModelSpec] = {
 # %%
 from trieste.acquisition.rule import EfficientGlobalOptimization
 from trieste.acquisition import (
-    SingleModelAcquisitionBuilder, ExpectedImprovement, Product
+    AcquisitionFunctionClass, SingleModelAcquisitionBuilder, ExpectedImprovement, Product
 )
 
+class probability_of_validity(AcquisitionFunctionClass):
+    def __init__(self, svgp):
+        # The predictive distribution below is only valid for a whitened SVGP with a single latent
+        # GP and a full-covariance variational distribution.
+        if not svgp.whiten or svgp.q_diag or svgp.num_latent_gps != 1:
+            raise ValueError(
+                "probability_of_validity requires a whitened SVGP with a single latent GP and a"
+                " full-covariance variational distribution"
+            )
+
+        self._svgp = svgp
+        alpha, var_update = self._precompute()
+        self._alpha = tf.Variable(alpha, trainable=False)
+        self._var_update = tf.Variable(var_update, trainable=False)
+
+    def _precompute(self):
+        # The SVGP posterior only changes between optimization steps, so we factorize the kernel
+        # matrix over the inducing points once per step, rather than on every acquisition evaluation.
+        svgp = self._svgp
+        Z = svgp.inducing_variable.Z
+        eye = tf.eye(tf.shape(Z)[0], dtype=Z.dtype)
+        Lzz = tf.linalg.cholesky(svgp.kernel(Z) + gpflow.config.default_jitter() * eye)
+        Lzz_inv = tf.linalg.triangular_solve(Lzz, eye)
+        alpha = tf.matmul(Lzz_inv, svgp.q_mu, transpose_a=True)  # L⁻ᵀ q_mu
+        S = tf.matmul(svgp.q_sqrt[0], svgp.q_sqrt[0], transpose_b=True)
+        var_update = tf.matmul(Lzz_inv, tf.matmul(S - eye, Lzz_inv), transpose_a=True)
+        return alpha, var_update
+
+    def update(self):
+        alpha, var_update = self._precompute()
+        self._alpha.assign(alpha)
+        self._var_update.assign(var_update)
+
+    @tf.function(jit_compile=True, experimental_relax_shapes=True)
+    def __call__(self, at):
+        svgp = self._svgp
+        x = tf.squeeze(at, -2)
+        Kxz = svgp.kernel(x, svgp.inducing_variable.Z)
+        f_mean = tf.matmul(Kxz, self._alpha) + svgp.mean_function(x)
+        f_var = svgp.kernel(x, full_cov=False)[:, None] + tf.reduce_sum(
+            tf.matmul(Kxz, self._var_update) * Kxz, axis=-1, keepdims=True
+        )
+        mean, _ = svgp.likelihood.predict_mean_and_var(f_mean, f_var)
+        return mean
+
 class ProbabilityOfValidity(SingleModelAcquisitionBuilder):
     def prepare_acquisition_function(self, model, dataset = None):
-        def acquisition(at):
-            mean, _ = model.predict_y(tf.squeeze(at, -2))
-            return mean
-        return acquisition
+        return probability_of_validity(model.model)
+
+    def update_acquisition_function(self, function, model, dataset = None):
+        # Reuse the traced (and compiled) function, only refreshing its precomputed values.
+        function.update()
+        return function
 
 ei = ExpectedImprovement()
 pov = ProbabilityOfValidity()
@@ -185,7 +250,7 @@ from util.plotting import plot_gp_2d, plot_function_2d, plot_bo_points
 
 mask_fail = result.datasets[FAILURE].observations.numpy().flatten().astype(int) == 0
 fig, ax = plot_function_2d(
-    masked_branin,
+    masked_branin_float32,
     search_space.lower,
     search_space.upper,
     grid_density=50,
@@ -50,6 +50,7 @@ from trieste.data import Dataset
 from trieste.models import ProbabilisticModel
 from trieste.objectives import BRANIN_MINIMUM, branin
 from trieste.types import TensorType
+from trieste.utils import DEFAULTS
 
 
 def test_expected_improvement_builder_builds_expected_improvement_using_best_from_model() -> None:
@@ -592,6 +593,21 @@ def test_batch_monte_carlo_expected_improvement_can_reproduce_ei() -> None:
     npt.assert_allclose(batch_ei(xs), ei(xs), rtol=0.06)
 
 
+@random_seed
+def test_batch_monte_carlo_expected_improvement_on_given_device() -> None:
+    known_query_points = tf.random.uniform([5, 2], dtype=tf.float64)
+    data = Dataset(known_query_points, quadratic(known_query_points))
+    model = QuadraticMeanAndRBFKernel()
+    builder = BatchMonteCarloExpectedImprovement(10_000, device="/CPU:0")
+    assert repr(builder) == (
+        f"BatchMonteCarloExpectedImprovement(10000, jitter={DEFAULTS.JITTER}, device='/CPU:0')"
+    )
+    batch_ei = builder.prepare_acquisition_function(model, dataset=data)
+    ei = ExpectedImprovement().prepare_acquisition_function(model, dataset=data)
+    xs = tf.random.uniform([3, 5, 1, 2], dtype=tf.float64)
+    npt.assert_allclose(batch_ei(xs), ei(xs), rtol=0.06)
+
+
 @random_seed
 def test_batch_monte_carlo_expected_improvement() -> None:
     xs = tf.random.uniform([3, 5, 7, 2], dtype=tf.float64)
@@ -0,0 +1,55 @@
+# Copyright 2021 The Trieste Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import importlib
+import subprocess
+import sys
+
+import pytest
+
+import trieste.acquisition
+import trieste.acquisition.function
+
+
+@pytest.mark.parametrize("name", trieste.acquisition.function.__all__)
+def test_function_package_exports_submodule_members(name: str) -> None:
+    exported = getattr(trieste.acquisition.function, name)
+    submodule = importlib.import_module(exported.__module__)
+
+    assert submodule.__name__.startswith("trieste.acquisition.function.")
+    assert getattr(submodule, name) is exported
+    assert name in dir(trieste.acquisition.function)
+
+
+@pytest.mark.parametrize(
+    "name", ["ExpectedImprovement", "MinValueEntropySearch", "soft_local_penalizer"]
+)
+def test_acquisition_package_forwards_function_exports(name: str) -> None:
+    assert getattr(trieste.acquisition, name) is getattr(trieste.acquisition.function, name)
+    assert vars(trieste.acquisition)[name] is getattr(trieste.acquisition.function, name)
+
+
+def test_importing_acquisition_rules_does_not_load_acquisition_functions() -> None:
+    code = (
+        "import sys, trieste.acquisition.rule; "
+        "assert 'trieste.acquisition.function.function' not in sys.modules"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@pytest.mark.parametrize("package", [trieste.acquisition, trieste.acquisition.function])
+def test_packages_raise_attribute_error_for_unknown_name(package: object) -> None:
+    with pytest.raises(AttributeError):
+        getattr(package, "NotAnAcquisitionFunction")
@@ -171,3 +171,44 @@ def test_lipschitz_penalizers_raises_for_invalid_pending_points_shape(
     lipshitz_constant = tf.constant([1], dtype=tf.float64)
     with pytest.raises(TF_DEBUGGING_ERROR_TYPES):
         soft_local_penalizer(QuadraticMeanAndRBFKernel(), pending_points, lipshitz_constant, best)
+
+
+@pytest.mark.parametrize("penalizer", [soft_local_penalizer, hard_local_penalizer])
+def test_lipschitz_penalizers_combine_all_pending_points_in_one_call(
+    penalizer: Callable[..., UpdatablePenalizationFunction],
+) -> None:
+    model = QuadraticMeanAndRBFKernel()
+    pending_points = tf.constant([[0.1, 0.2], [-0.3, 0.4], [0.5, -0.6]], dtype=tf.float64)
+    best = tf.constant([0], dtype=tf.float64)
+    lipshitz_constant = tf.constant([1], dtype=tf.float64)
+    x = tf.constant([[[0.0, 0.0]], [[1.0, -1.0]], [[-0.5, 0.5]]], dtype=tf.float64)
+
+    combined = penalizer(model, pending_points, lipshitz_constant, best)(x)
+    individual = [
+        penalizer(model, pending_points[i : i + 1], lipshitz_constant, best)(x)
+        for i in range(len(pending_points))
+    ]
+
+    npt.assert_allclose(combined, tf.reduce_prod(tf.stack(individual), axis=0))
+
+
+@pytest.mark.parametrize("penalizer", [soft_local_penalizer, hard_local_penalizer])
+def test_lipschitz_penalizers_update_accepts_python_values(
+    penalizer: Callable[..., UpdatablePenalizationFunction],
+) -> None:
+    model = QuadraticMeanAndRBFKernel()
+    pending_points = tf.zeros([1, 2], dtype=tf.float64)
+    best = tf.constant([0], dtype=tf.float64)
+    lipshitz_constant = tf.constant([1], dtype=tf.float64)
+    x = tf.constant([[[0.5, 0.5]], [[1.0, -1.0]]], dtype=tf.float64)
+
+    lp = penalizer(model, pending_points, lipshitz_constant, best)
+    lp.update([[0.1, 0.2], [0.3, 0.4]], 2.0, -1.0)
+
+    expected = penalizer(
+        model,
+        tf.constant([[0.1, 0.2], [0.3, 0.4]], dtype=tf.float64),
+        tf.constant(2.0, dtype=tf.float64),
+        tf.constant(-1.0, dtype=tf.float64),
+    )
+    npt.assert_allclose(lp(x), expected(x))
@@ -103,6 +103,77 @@ def test_product() -> None:
     npt.assert_allclose(acq(xs), (xs + 1) * (xs + 2))
 
 
+def test_reducer_update_acquisition_function_updates_each_builder() -> None:
+    class _Updatable(AcquisitionFunctionBuilder):
+        def __init__(self) -> None:
+            self.offset = tf.Variable(0.0)
+            self.num_prepares = 0
+
+        def prepare_acquisition_function(
+            self,
+            models: Mapping[str, ProbabilisticModel],
+            datasets: Optional[Mapping[str, Dataset]] = None,
+        ) -> AcquisitionFunction:
+            self.num_prepares += 1
+            return lambda x: x + self.offset
+
+        def update_acquisition_function(
+            self,
+            function: AcquisitionFunction,
+            models: Mapping[str, ProbabilisticModel],
+            datasets: Optional[Mapping[str, Dataset]] = None,
+        ) -> AcquisitionFunction:
+            self.offset.assign_add(1.0)
+            return function
+
+    updatable = _Updatable()
+    sum_ = Sum(updatable, _Static(lambda x: 2.0 * x))
+    data, models = {"": empty_dataset([1], [1])}, {"": QuadraticMeanAndRBFKernel()}
+    acq = sum_.prepare_acquisition_function(models, datasets=data)
+    xs = tf.random.uniform([3, 5, 1], minval=-1.0)
+    npt.assert_allclose(acq(xs), 3.0 * xs)
+
+    updated_acq = sum_.update_acquisition_function(acq, models, datasets=data)
+    assert updated_acq is acq
+    assert updatable.num_prepares == 1
+    npt.assert_allclose(updated_acq(xs), 3.0 * xs + 1.0)
+
+
+def test_reducer_update_acquisition_function_only_updates_the_given_function() -> None:
+    class _Counting(AcquisitionFunctionBuilder):
+        def __init__(self) -> None:
+            self.num_prepares = 0
+
+        def prepare_acquisition_function(
+            self,
+            models: Mapping[str, ProbabilisticModel],
+            datasets: Optional[Mapping[str, Dataset]] = None,
+        ) -> AcquisitionFunction:
+            self.num_prepares += 1
+            offset = float(self.num_prepares)
+            return lambda x: x + offset
+
+    sum_ = Sum(_Counting())
+    data, models = {"": empty_dataset([1], [1])}, {"": QuadraticMeanAndRBFKernel()}
+    xs = tf.random.uniform([3, 5, 1], minval=-1.0)
+    first_acq = sum_.prepare_acquisition_function(models, datasets=data)
+    second_acq = sum_.prepare_acquisition_function(models, datasets=data)
+
+    updated_acq = sum_.update_acquisition_function(first_acq, models, datasets=data)
+
+    assert updated_acq is first_acq
+    npt.assert_allclose(first_acq(xs), xs + 3.0)
+    npt.assert_allclose(second_acq(xs), xs + 2.0)
+
+
+def test_reducer_prepare_batched_reduces_each_task() -> None:
+    sum_ = Sum(_Static(lambda x: x), _Static(lambda x: x ** 2))
+    data, models = {"": empty_dataset([1], [1])}, {"": QuadraticMeanAndRBFKernel()}
+    acq = sum_.prepare_acquisition_function_batched([models, models], datasets=[data, data])
+    xs = tf.random.uniform([2, 3, 5, 1], minval=-1.0)
+    npt.assert_allclose(acq(xs), xs + xs ** 2)
+
+
 @pytest.mark.parametrize("reducer_class", [Sum, Product])
 def test_sum_and_product_for_single_builder(reducer_class: type[Sum | Product]) -> None:
     data, models = {"": empty_dataset([1], [1])}, {"": QuadraticMeanAndRBFKernel()}
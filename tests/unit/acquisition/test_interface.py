@@ -15,9 +15,11 @@ from __future__ import annotations
 
 from typing import Optional
 
+import numpy.testing as npt
 import pytest
+import tensorflow as tf
 
-from tests.util.misc import empty_dataset, raise_exc
+from tests.util.misc import TF_DEBUGGING_ERROR_TYPES, empty_dataset, raise_exc
 from tests.util.models.gpflow.models import QuadraticMeanAndRBFKernel
 from trieste.acquisition import (
     AugmentedExpectedImprovement,
@@ -31,8 +33,10 @@ from trieste.acquisition import (
     PredictiveVariance,
     ProbabilityOfFeasibility,
 )
+from trieste.acquisition.function.function import expected_improvement
 from trieste.acquisition.interface import (
     AcquisitionFunction,
+    AcquisitionFunctionClass,
     SingleModelAcquisitionBuilder,
     SingleModelGreedyAcquisitionBuilder,
 )
@@ -91,6 +95,59 @@ def test_single_model_acquisition_builder_using_passes_on_correct_dataset_and_mo
     Builder().using("foo").prepare_acquisition_function(models, datasets=data)
 
 
+def test_acquisition_builder_prepare_batched_evaluates_each_task_separately() -> None:
+    builder = NegativePredictiveMean().using("foo")
+    models = [{"foo": QuadraticMeanAndRBFKernel(x_shift=shift)} for shift in [0.0, 1.0, -2.0]]
+    datasets = [{"foo": empty_dataset([1], [1])} for _ in models]
+    batched = builder.prepare_acquisition_function_batched(models, datasets=datasets)
+
+    xs = tf.random.uniform([3, 5, 1, 1], minval=-1.0, dtype=tf.float64)
+    expected = [
+        builder.prepare_acquisition_function(task_models)(xs[t])
+        for t, task_models in enumerate(models)
+    ]
+    npt.assert_allclose(batched(xs), tf.stack(expected))
+
+
+def test_acquisition_builder_prepare_batched_raises_for_wrong_number_of_tasks() -> None:
+    builder = NegativePredictiveMean().using("foo")
+    models = [{"foo": QuadraticMeanAndRBFKernel()}, {"foo": QuadraticMeanAndRBFKernel()}]
+
+    with pytest.raises(TF_DEBUGGING_ERROR_TYPES):
+        builder.prepare_acquisition_function_batched([])
+
+    with pytest.raises(TF_DEBUGGING_ERROR_TYPES):
+        builder.prepare_acquisition_function_batched(
+            models, datasets=[{"foo": empty_dataset([1], [1])}]
+        )
+
+    batched = builder.prepare_acquisition_function_batched(models)
+    with pytest.raises(TF_DEBUGGING_ERROR_TYPES):
+        batched(tf.zeros([3, 5, 1, 1], dtype=tf.float64))
+
+
+def test_acquisition_function_class_get_concrete_function_is_cached_and_sees_updates() -> None:
+    function = expected_improvement(QuadraticMeanAndRBFKernel(), tf.constant([0.0], tf.float64))
+    spec = tf.TensorSpec([None, 1, 1], tf.float64)
+    concrete = function.get_concrete_function(spec)
+    assert function.get_concrete_function(tf.TensorSpec([None, 1, 1], tf.float64)) is concrete
+
+    xs = tf.random.uniform([5, 1, 1], minval=-1.0, dtype=tf.float64)
+    npt.assert_allclose(concrete(xs), function(xs))
+
+    function.update(tf.constant([1.0], tf.float64))
+    npt.assert_allclose(concrete(xs), function(xs))
+
+
+def test_acquisition_function_class_get_concrete_function_raises_if_not_traceable() -> None:
+    class _Untraced(AcquisitionFunctionClass):
+        def __call__(self, x: TensorType) -> TensorType:
+            return x
+
+    with pytest.raises(ValueError):
+        _Untraced().get_concrete_function(tf.TensorSpec([None, 1, 1], tf.float64))
+
+
 def test_single_model_greedy_acquisition_builder_raises_immediately_for_wrong_key() -> None:
     builder = _ArbitraryGreedySingleBuilder().using("foo")
 
@@ -24,7 +24,7 @@ from gpflow.optimizers import Scipy
 from scipy.optimize import OptimizeResult
 
 from tests.util.misc import TF_DEBUGGING_ERROR_TYPES, quadratic, random_seed
-from trieste.acquisition import AcquisitionFunction
+from trieste.acquisition import AcquisitionFunction, AcquisitionFunctionClass
 from trieste.acquisition.optimizer import (
     AcquisitionOptimizer,
     FailedOptimizationError,
@@ -50,6 +50,8 @@ def _delta_function(power: float) -> AcquisitionFunction:
 def test_generate_random_search_optimizer_raises_with_invalid_sample_size() -> None:
     with pytest.raises(ValueError):
         generate_random_search_optimizer(num_samples=-5)
+    with pytest.raises(ValueError):
+        generate_random_search_optimizer(num_evaluations_per_chunk=0)
 
 
 SP = TypeVar("SP", bound=SearchSpace)
@@ -105,6 +107,24 @@ def test_discrete_and_random_optimizer(
             npt.assert_allclose(maximizer, expected_maximizer, rtol=1e-1)
 
 
+@random_seed
+def test_random_search_optimizer_evaluates_samples_in_chunks() -> None:
+    shift = [0.3, -0.4]
+    batch_sizes: list[int] = []
+
+    def target_function(x: TensorType) -> TensorType:
+        batch_sizes.append(x.shape[0])
+        return _quadratic_sum(shift)(x)
+
+    optimizer: AcquisitionOptimizer[Box] = generate_random_search_optimizer(
+        10_000, num_evaluations_per_chunk=3_000
+    )
+    maximizer = optimizer(Box([-1, -2], [1.5, 2.5]), target_function)
+
+    assert batch_sizes == [3_000, 3_000, 3_000, 1_000]
+    npt.assert_allclose(maximizer, [shift], rtol=1e-1)
+
+
 def test_generate_continuous_optimizer_raises_with_invalid_init_params() -> None:
     with pytest.raises(ValueError):
         generate_continuous_optimizer(num_initial_samples=-5)
@@ -114,6 +134,8 @@ def test_generate_continuous_optimizer_raises_with_invalid_init_params() -> None
         generate_continuous_optimizer(num_optimization_runs=5, num_initial_samples=4)
     with pytest.raises(ValueError):
         generate_continuous_optimizer(num_recovery_runs=-5)
+    with pytest.raises(ValueError):
+        generate_continuous_optimizer(num_evaluations_per_chunk=0)
 
 
 @random_seed
@@ -223,6 +245,88 @@ def test_continuous_optimizer(
     npt.assert_allclose(maximizer, expected_maximizer, rtol=1e-3)
 
 
+@pytest.mark.parametrize("num_optimization_runs", [1, 4])
+def test_continuous_optimizer_evaluates_optimization_runs_together(
+    num_optimization_runs: int,
+) -> None:
+    input_shapes = []
+    target_func = _quadratic_sum([0.5, -0.2])
+
+    def recording_target_func(x: TensorType) -> TensorType:
+        input_shapes.append(x.shape)
+        return target_func(x)
+
+    optimizer = generate_continuous_optimizer(
+        num_initial_samples=10, num_optimization_runs=num_optimization_runs
+    )
+    maximizer = optimizer(Box([-1, -1], [1, 1]), recording_target_func)
+
+    npt.assert_allclose(maximizer, [[0.5, -0.2]], rtol=1e-3)
+    assert input_shapes[0] == [10, 1, 2]
+    assert all(shape == [num_optimization_runs, 1, 2] for shape in input_shapes[1:])
+
+
+def test_continuous_optimizer_traces_acquisition_function_classes_once() -> None:
+    class _Quadratic(AcquisitionFunctionClass):
+        def __init__(self) -> None:
+            self.num_traces = 0
+
+        @tf.function
+        def __call__(self, x: TensorType) -> TensorType:
+            self.num_traces += 1
+            return _quadratic_sum([0.5, -0.2])(x)
+
+    target_func = _Quadratic()
+    optimizer = generate_continuous_optimizer(num_initial_samples=10, num_optimization_runs=2)
+    maximizer = optimizer(Box([-1.0, -1.0], [1.0, 1.0]), target_func)
+
+    npt.assert_allclose(maximizer, [[0.5, -0.2]], rtol=1e-3)
+    assert target_func.num_traces == 1
+
+
+def test_continuous_optimizer_optimizes_acquisition_function_classes_without_tf_function() -> None:
+    class _Quadratic(AcquisitionFunctionClass):
+        def __call__(self, x: TensorType) -> TensorType:
+            return _quadratic_sum([0.5, -0.2])(x)
+
+    optimizer = generate_continuous_optimizer(num_initial_samples=10, num_optimization_runs=2)
+    maximizer = optimizer(Box([-1.0, -1.0], [1.0, 1.0]), _Quadratic())
+
+    npt.assert_allclose(maximizer, [[0.5, -0.2]], rtol=1e-3)
+
+
+def test_continuous_optimizer_raises_errors_from_tracing_acquisition_function_classes() -> None:
+    class _StaticBatchOnly(AcquisitionFunctionClass):
+        @tf.function
+        def __call__(self, x: TensorType) -> TensorType:
+            if x.shape[0] is None:
+                raise ValueError("the number of query points must be known statically")
+            return _quadratic_sum([0.5, -0.2])(x)
+
+    optimizer = generate_continuous_optimizer(num_initial_samples=10)
+
+    with pytest.raises(ValueError, match="must be known statically"):
+        optimizer(Box([-1.0, -1.0], [1.0, 1.0]), _StaticBatchOnly())
+
+
+def test_continuous_optimizer_uses_optimizer_args_without_copying_them() -> None:
+    class _RecordingCallback:
+        def __init__(self) -> None:
+            self.num_calls = 0
+
+        def __call__(self, *args: Any) -> None:
+            self.num_calls += 1
+
+    step_callback = _RecordingCallback()
+    optimizer_args = {"step_callback": step_callback}
+    optimizer = generate_continuous_optimizer(num_initial_samples=10, optimizer_args=optimizer_args)
+    maximizer = optimizer(Box([-1, -1], [1, 1]), _quadratic_sum([0.5, -0.2]))
+
+    npt.assert_allclose(maximizer, [[0.5, -0.2]], rtol=1e-3)
+    assert step_callback.num_calls > 0
+    assert optimizer_args == {"step_callback": step_callback}
+
+
 @pytest.mark.parametrize(
     "search_space, point",
     [
@@ -316,12 +420,31 @@ def test_optimize_continuous_raises_for_impossible_optimization(
     assert (
         str(e.value)
         == f"""
-                    Acquisition function optimization failed,
-                    even after {num_recovery_runs + num_optimization_runs} restarts.
+                    Acquisition function optimization failed from all {num_optimization_runs}
+                    starting points, and in {num_recovery_runs} recovery runs.
                     """
     )
 
 
+def test_optimize_continuous_repeats_runs_separately_if_joint_optimization_fails() -> None:
+    scipy_minimize = gpflow.optimizers.Scipy.minimize
+    num_points_per_run: list[int] = []
+
+    def mock_minimize(self: Scipy, *args: Any, **kwargs: Any) -> OptimizeResult:
+        num_points = args[1][0].shape[0]
+        num_points_per_run.append(num_points)
+        result = scipy_minimize(self, *args, **kwargs)
+        result.success = num_points == 1
+        return result
+
+    with unittest.mock.patch("gpflow.optimizers.Scipy.minimize", mock_minimize):
+        optimizer = generate_continuous_optimizer(num_optimization_runs=3, num_recovery_runs=0)
+        maximizer = optimizer(Box([-1], [1]), _quadratic_sum([0.5]))
+
+    npt.assert_allclose(maximizer, [[0.5]], rtol=1e-3)
+    assert num_points_per_run == [3, 1, 1, 1]
+
+
 @pytest.mark.parametrize("num_failed_runs", range(4))
 @pytest.mark.parametrize("num_recovery_runs", range(4))
 def test_optimize_continuous_recovery_runs(num_failed_runs: int, num_recovery_runs: int) -> None:
@@ -28,15 +28,19 @@ from trieste.types import TensorType
 
 
 def _batcher_bs_100(dataset: Dataset, batch_size: int) -> Iterable[tuple[TensorType, TensorType]]:
-    ds = tf.data.Dataset.from_tensor_slices(dataset.astuple())
-    ds = ds.shuffle(100)
-    ds = ds.batch(batch_size)
+    ds = tf.data.Dataset.from_tensor_slices((dataset.query_points, dataset.observations))
+    ds = ds.cache()
+    ds = ds.shuffle(100, reshuffle_each_iteration=True)
+    ds = ds.batch(batch_size, drop_remainder=True)
     ds = ds.repeat()
+    ds = ds.prefetch(tf.data.experimental.AUTOTUNE)
     return iter(ds)
 
 
 def _batcher_full_batch(dataset: Dataset, batch_size: int) -> tuple[TensorType, TensorType]:
-    return dataset.astuple()
+    # GPflow's training loss closures accept a tuple of tensors as-is, so there's no need to go
+    # through tf.data (and unbatch then rebatch the full dataset) here
+    return dataset.query_points, dataset.observations
 
 
 @pytest.fixture(name="batcher", params=[_batcher_bs_100, _batcher_full_batch])
@@ -49,7 +53,11 @@ def _compile_fixture(request: Any) -> bool:
     return request.param
 
 
-@pytest.fixture(name="two_layer_model", params=[two_layer_dgp_model, simple_two_layer_dgp_model])
+@pytest.fixture(
+    name="two_layer_model",
+    params=[two_layer_dgp_model, simple_two_layer_dgp_model],
+    scope="module",
+)
 def _two_layer_model_fixture(request: Any) -> Callable[[TensorType], DeepGP]:
     return request.param
 
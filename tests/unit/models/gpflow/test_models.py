@@ -26,7 +26,7 @@ trieste model).
 from __future__ import annotations
 
 import unittest.mock
-from typing import Any
+from typing import Any, Callable
 
 import gpflow
 import numpy as np
@@ -55,6 +55,7 @@ from trieste.models.gpflow import (
     VariationalGaussianProcess,
 )
 from trieste.models.optimizer import BatchOptimizer, DatasetTransformer, Optimizer, create_optimizer
+from trieste.types import TensorType
 
 
 def _3x_plus_gaussian_noise(x: tf.Tensor) -> tf.Tensor:
@@ -78,6 +79,32 @@ def test_gaussian_process_regression_loss(gpflow_interface_factory: ModelFactory
     )
 
 
+@pytest.mark.parametrize(
+    "model_type, model_builder",
+    [
+        (GaussianProcessRegression, gpr_model),
+        (SparseVariational, svgp_model),
+        (VariationalGaussianProcess, vgp_model),
+    ],
+)
+def test_gpflow_predictor_predictions_on_given_device(
+    model_type: type[GaussianProcessRegression | SparseVariational | VariationalGaussianProcess],
+    model_builder: Callable[[tf.Tensor, tf.Tensor], gpflow.models.GPModel],
+) -> None:
+    x = tf.constant(np.arange(5).reshape(-1, 1), dtype=gpflow.default_float())
+    y = fnc_3x_plus_10(x)
+    model = model_type(model_builder(x, y), device="/CPU:0")
+    reference_model = model_type(model_builder(x, y))
+    x_predict = tf.constant([[0.5], [2.5]], gpflow.default_float())
+
+    for actual, expected in zip(model.predict(x_predict), reference_model.predict(x_predict)):
+        npt.assert_allclose(actual, expected)
+    for actual, expected in zip(
+        model.predict_joint(x_predict), reference_model.predict_joint(x_predict)
+    ):
+        npt.assert_allclose(actual, expected)
+
+
 def test_gaussian_process_regression_update(gpflow_interface_factory: ModelFactoryType) -> None:
     x = tf.constant(np.arange(5).reshape(-1, 1), dtype=gpflow.default_float())
     y = fnc_3x_plus_10(x)
@@ -101,6 +128,41 @@ def test_gaussian_process_regression_update(gpflow_interface_factory: ModelFacto
     )
 
 
+def test_gaussian_process_regression_predict_matches_gpflow_after_reassigning_parameters() -> None:
+    x = tf.constant(np.arange(5).reshape(-1, 1), dtype=gpflow.default_float())
+    model = GaussianProcessRegression(gpr_model(x, fnc_3x_plus_10(x)))
+    x_predict = tf.constant([[0.5], [2.5], [7.0]], gpflow.default_float())
+    predict = tf.function(model.predict)
+    predict(x_predict)
+
+    model.model.kernel.lengthscales.assign(2.0)
+    model.model.likelihood.variance.assign(0.5)
+
+    for actual, expected in zip(predict(x_predict), model.model.predict_f(x_predict)):
+        npt.assert_allclose(actual, expected)
+
+
+def test_gaussian_process_regression_predict_gradients_match_gpflow() -> None:
+    x = tf.constant(np.arange(5).reshape(-1, 1), dtype=gpflow.default_float())
+    model = GaussianProcessRegression(gpr_model(x, fnc_3x_plus_10(x)))
+    x_predict = tf.Variable([[0.5], [2.5], [7.0]], dtype=gpflow.default_float())
+    lengthscales = model.model.kernel.lengthscales.unconstrained_variable
+
+    @tf.function
+    def gradients(predict: Callable[[TensorType], tuple[TensorType, TensorType]]) -> list[Any]:
+        with tf.GradientTape() as tape:
+            mean, variance = predict(x_predict)
+            loss = tf.reduce_sum(mean) + tf.reduce_sum(variance)
+        return tape.gradient(loss, [x_predict, lengthscales])
+
+    gradients(model.predict)
+    actual = gradients(model.predict)  # the second call is the one that could reuse any state
+    expected = gradients(model.model.predict_f)
+
+    for actual_gradient, expected_gradient in zip(actual, expected):
+        npt.assert_allclose(actual_gradient, expected_gradient)
+
+
 def test_gaussian_process_regression_ref_optimize(
     gpflow_interface_factory: ModelFactoryType,
 ) -> None:
@@ -417,17 +479,20 @@ def test_vgp_update() -> None:
     npt.assert_allclose(m.model.q_sqrt, reference_model_new.q_sqrt, atol=1e-5)
 
 
-@random_seed
 def test_vgp_update_q_mu_sqrt_unchanged() -> None:
     x_observed = tf.constant(np.arange(10).reshape((-1, 1)), dtype=gpflow.default_float())
     y_observed = fnc_2sin_x_over_3(x_observed)
     model = VariationalGaussianProcess(vgp_matern_model(x_observed, y_observed))
 
-    old_q_mu = model.model.q_mu.numpy()
-    old_q_sqrt = model.model.q_sqrt.numpy()
+    q_mu, q_sqrt = model.model.q_mu, model.model.q_sqrt
+    old_q_mu = q_mu.numpy()
+    old_q_sqrt = q_sqrt.numpy()
     data = Dataset(x_observed, y_observed)
     model.update(data)
 
+    assert model.model.q_mu is q_mu
+    assert model.model.q_sqrt is q_sqrt
+
     new_q_mu = model.model.q_mu.numpy()
     new_q_sqrt = model.model.q_sqrt.numpy()
 
@@ -33,7 +33,6 @@ import numpy.testing as npt
 import pytest
 import tensorflow as tf
 from gpflux.models import DeepGP
-from gpflux.models.deep_gp import sample_dgp
 
 from tests.util.misc import random_seed
 from tests.util.models.gpflux.models import single_layer_dgp_model
@@ -108,19 +107,27 @@ def test_dgp_update(two_layer_model: Callable[[TensorType], DeepGP]) -> None:
         assert layer.num_data == 5
 
 
+@pytest.fixture(name="invalid_shapes_model", scope="module")
+def _invalid_shapes_model_fixture(
+    two_layer_model: Callable[[TensorType], DeepGP]
+) -> DeepGaussianProcess:
+    return DeepGaussianProcess(two_layer_model(tf.zeros([1, 4])))
+
+
 @pytest.mark.parametrize(
     "new_data",
     [Dataset(tf.zeros([3, 5]), tf.zeros([3, 1])), Dataset(tf.zeros([3, 4]), tf.zeros([3, 2]))],
 )
 def test_dgp_update_raises_for_invalid_shapes(
-    two_layer_model: Callable[[TensorType], DeepGP], new_data: Dataset
+    invalid_shapes_model: DeepGaussianProcess, new_data: Dataset
 ) -> None:
-    x = tf.zeros([1, 4])
-    dgp = two_layer_model(x)
-    model = DeepGaussianProcess(dgp)
-
     with pytest.raises(ValueError):
-        model.update(new_data)
+        invalid_shapes_model.update(new_data)
+
+    assert invalid_shapes_model.model_gpflux.num_data == 1
+
+    for layer in invalid_shapes_model.model_gpflux.f_layers:
+        assert layer.num_data == 1
 
 
 def test_dgp_optimize_with_defaults(
@@ -156,26 +163,78 @@ def test_dgp_optimize(
     assert model.model_gpflux.elbo(data) > elbo
 
 
+def test_dgp_optimize_without_shuffling(
+    two_layer_model: Callable[[TensorType], DeepGP], keras_float: None
+) -> None:
+    x_observed = np.linspace(0, 100, 100).reshape((-1, 1))
+    y_observed = fnc_2sin_x_over_3(x_observed)
+    data = x_observed, y_observed
+    dataset = Dataset(*data)
+
+    fit_args = {"batch_size": 10, "epochs": 10, "verbose": 0, "shuffle": False}
+
+    model = DeepGaussianProcess(two_layer_model(x_observed), fit_args=fit_args)
+    elbo = model.model_gpflux.elbo(data)
+    model.optimize(dataset)
+    assert model.model_gpflux.elbo(data) > elbo
+
+
+def test_dgp_optimize_with_validation_split(
+    two_layer_model: Callable[[TensorType], DeepGP], keras_float: None
+) -> None:
+    x_observed = np.linspace(0, 100, 100).reshape((-1, 1))
+    y_observed = fnc_2sin_x_over_3(x_observed)
+    data = x_observed, y_observed
+    dataset = Dataset(*data)
+
+    fit_args = {"batch_size": 10, "epochs": 10, "verbose": 0, "validation_split": 0.2}
+
+    model = DeepGaussianProcess(two_layer_model(x_observed), fit_args=fit_args)
+    elbo = model.model_gpflux.elbo(data)
+    model.optimize(dataset)
+    assert model.model_gpflux.elbo(data) > elbo
+    assert "val_loss" in model.model_keras.history.history
+
+
+def test_dgp_optimize_with_compile_args(
+    two_layer_model: Callable[[TensorType], DeepGP], keras_float: None
+) -> None:
+    x_observed = np.linspace(0, 100, 100).reshape((-1, 1))
+    y_observed = fnc_2sin_x_over_3(x_observed)
+    data = x_observed, y_observed
+    dataset = Dataset(*data)
+
+    fit_args = {"batch_size": 10, "epochs": 10, "verbose": 0}
+    compile_args = {"steps_per_execution": 5}
+
+    model = DeepGaussianProcess(
+        two_layer_model(x_observed), fit_args=fit_args, compile_args=compile_args
+    )
+    elbo = model.model_gpflux.elbo(data)
+    model.optimize(dataset)
+    assert model.model_gpflux.elbo(data) > elbo
+
+
 def test_dgp_loss(two_layer_model: Callable[[TensorType], DeepGP]) -> None:
     x = tf.constant(np.arange(5).reshape(-1, 1), dtype=gpflow.default_float())
     y = fnc_3x_plus_10(x)
 
-    reference_model = two_layer_model(x)
-    model = DeepGaussianProcess(two_layer_model(x))
+    dgp = two_layer_model(x)
+    reference_elbo = dgp.elbo((x, y))
+    model = DeepGaussianProcess(dgp)
     internal_model = model.model_gpflux
 
-    npt.assert_allclose(internal_model.elbo((x, y)), reference_model.elbo((x, y)), rtol=1e-6)
+    npt.assert_allclose(internal_model.elbo((x, y)), reference_elbo, rtol=1e-6)
 
 
 def test_dgp_predict() -> None:
     x = tf.constant(np.arange(5).reshape(-1, 1), dtype=gpflow.default_float())
 
-    reference_model = single_layer_dgp_model(x)
-    model = DeepGaussianProcess(single_layer_dgp_model(x))
-
+    dgp = single_layer_dgp_model(x)
     test_x = tf.constant([[2.5]], dtype=gpflow.default_float())
+    ref_mean, ref_var = dgp.predict_f(test_x)
 
-    ref_mean, ref_var = reference_model.predict_f(test_x)
+    model = DeepGaussianProcess(dgp)
     f_mean, f_var = model.predict(test_x)
 
     npt.assert_allclose(f_mean, ref_mean)
@@ -196,20 +255,10 @@ def test_dgp_sample(two_layer_model: Callable[[TensorType], DeepGP]) -> None:
     assert samples.shape == [num_samples, 1, 1]
 
     sample_mean = tf.reduce_mean(samples, axis=0)
-    sample_variance = tf.reduce_mean((samples - sample_mean) ** 2)
-
-    reference_model = two_layer_model(x)
-
-    def get_samples(query_points: TensorType, num_samples: int) -> TensorType:
-        samples = []
-        for _ in range(num_samples):
-            samples.append(sample_dgp(reference_model)(query_points))
-        return tf.stack(samples)
-
-    ref_samples = get_samples(test_x, num_samples)
+    sample_variance = tf.math.reduce_variance(samples, axis=0)
 
-    ref_mean = tf.reduce_mean(ref_samples, axis=0)
-    ref_variance = tf.reduce_mean((ref_samples - ref_mean) ** 2)
+    # the reference moments are computed independently of sampling, by the model's predictions
+    ref_mean, ref_variance = model.predict(test_x)
 
     error = 1 / tf.sqrt(tf.cast(num_samples, tf.float32))
     npt.assert_allclose(sample_mean, ref_mean, atol=2 * error)
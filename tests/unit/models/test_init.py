@@ -0,0 +1,33 @@
+# Copyright 2021 The Trieste Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+from __future__ import annotations
+
+import importlib
+
+import pytest
+
+import trieste.models
+
+
+def test_models_package_imports_gpflux_subpackage_on_access() -> None:
+    gpflux = trieste.models.gpflux
+
+    assert gpflux is importlib.import_module("trieste.models.gpflux")
+    assert trieste.models.gpflux is gpflux
+    assert "gpflux" in dir(trieste.models)
+
+
+def test_models_package_raises_attribute_error_for_unknown_name() -> None:
+    with pytest.raises(AttributeError):
+        getattr(trieste.models, "not_a_model_package")
@@ -34,36 +34,12 @@ acquisition function should take. Additionally, acquisition functions and builde
 are designed to minimize the objective function. For example, we do not provide an implementation of
 UCB.
 """
-from . import optimizer, rule
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from . import function, optimizer, rule
 from .combination import Product, Reducer, Sum
-from .function import (
-    GIBBON,
-    AugmentedExpectedImprovement,
-    BatchMonteCarloExpectedHypervolumeImprovement,
-    BatchMonteCarloExpectedImprovement,
-    ExpectedConstrainedHypervolumeImprovement,
-    ExpectedConstrainedImprovement,
-    ExpectedHypervolumeImprovement,
-    ExpectedImprovement,
-    LocalPenalizationAcquisitionFunction,
-    MinValueEntropySearch,
-    NegativeLowerConfidenceBound,
-    NegativePredictiveMean,
-    PredictiveVariance,
-    ProbabilityOfFeasibility,
-    augmented_expected_improvement,
-    batch_ehvi,
-    expected_hv_improvement,
-    expected_improvement,
-    gibbon_quality_term,
-    gibbon_repulsion_term,
-    hard_local_penalizer,
-    lower_confidence_bound,
-    min_value_entropy_search,
-    predictive_variance,
-    probability_of_feasibility,
-    soft_local_penalizer,
-)
 from .interface import (
     AcquisitionFunction,
     AcquisitionFunctionBuilder,
@@ -81,3 +57,85 @@ from .sampler import (
     IndependentReparametrizationSampler,
     RandomFourierFeatureThompsonSampler,
 )
+
+if TYPE_CHECKING:
+    from .function import (
+        GIBBON,
+        AugmentedExpectedImprovement,
+        BatchMonteCarloExpectedHypervolumeImprovement,
+        BatchMonteCarloExpectedImprovement,
+        ExpectedConstrainedHypervolumeImprovement,
+        ExpectedConstrainedImprovement,
+        ExpectedHypervolumeImprovement,
+        ExpectedImprovement,
+        LocalPenalizationAcquisitionFunction,
+        MinValueEntropySearch,
+        NegativeLowerConfidenceBound,
+        NegativePredictiveMean,
+        PredictiveVariance,
+        ProbabilityOfFeasibility,
+        augmented_expected_improvement,
+        batch_ehvi,
+        expected_hv_improvement,
+        expected_improvement,
+        gibbon_quality_term,
+        gibbon_repulsion_term,
+        hard_local_penalizer,
+        lower_confidence_bound,
+        min_value_entropy_search,
+        predictive_variance,
+        probability_of_feasibility,
+        soft_local_penalizer,
+    )
+
+_FUNCTION_EXPORTS = frozenset(
+    {
+        "GIBBON",
+        "AugmentedExpectedImprovement",
+        "BatchMonteCarloExpectedHypervolumeImprovement",
+        "BatchMonteCarloExpectedImprovement",
+        "ExpectedConstrainedHypervolumeImprovement",
+        "ExpectedConstrainedImprovement",
+        "ExpectedHypervolumeImprovement",
+        "ExpectedImprovement",
+        "LocalPenalizationAcquisitionFunction",
+        "MinValueEntropySearch",
+        "NegativeLowerConfidenceBound",
+        "NegativePredictiveMean",
+        "PredictiveVariance",
+        "ProbabilityOfFeasibility",
+        "augmented_expected_improvement",
+        "batch_ehvi",
+        "expected_hv_improvement",
+        "expected_improvement",
+        "gibbon_quality_term",
+        "gibbon_repulsion_term",
+        "hard_local_penalizer",
+        "lower_confidence_bound",
+        "min_value_entropy_search",
+        "predictive_variance",
+        "probability_of_feasibility",
+        "soft_local_penalizer",
+    }
+)
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Forward the acquisition functions re-exported from :mod:`~trieste.acquisition.function`, which
+    loads each acquisition function submodule only when one of its members is first accessed.
+
+    :param name: The attribute name.
+    :return: The attribute.
+    :raise AttributeError: If this package doesn't export ``name``.
+    """
+    if name not in _FUNCTION_EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(function, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_FUNCTION_EXPORTS})
@@ -15,14 +15,14 @@ from __future__ import annotations
 
 from abc import abstractmethod
 from collections.abc import Mapping, Sequence
-from typing import Optional
+from typing import Callable, Optional
 
 import tensorflow as tf
 
 from ..data import Dataset
 from ..models import ProbabilisticModel
 from ..types import TensorType
-from .interface import AcquisitionFunction, AcquisitionFunctionBuilder
+from .interface import AcquisitionFunction, AcquisitionFunctionBuilder, AcquisitionFunctionClass
 
 
 class Reducer(AcquisitionFunctionBuilder):
@@ -66,14 +66,59 @@ class Reducer(AcquisitionFunctionBuilder):
         functions = tuple(
             acq.prepare_acquisition_function(models, datasets=datasets) for acq in self.acquisitions
         )
+        return _ReducedAcquisitionFunction(self._reduce_acquisition_functions, functions)
+
+    def update_acquisition_function(
+        self,
+        function: AcquisitionFunction,
+        models: Mapping[str, ProbabilisticModel],
+        datasets: Optional[Mapping[str, Dataset]] = None,
+    ) -> AcquisitionFunction:
+        r"""
+        Update the acquisition function. This updates each of the constituent acquisition
+        functions with its :class:`~trieste.acquisition.AcquisitionFunctionBuilder`, so that any
+        constituent that can be updated in place isn't retraced. If ``function`` wasn't built by
+        this :class:`Reducer`, a new acquisition function is prepared instead.
+
+        :param function: The acquisition function to update.
+        :param datasets: The data from the observer.
+        :param models: The models over each dataset in ``datasets``.
+        :return: The updated acquisition function.
+        """
+        if not isinstance(function, _ReducedAcquisitionFunction):
+            return self.prepare_acquisition_function(models, datasets=datasets)
+
+        function.functions = tuple(
+            acq.update_acquisition_function(fn, models, datasets=datasets)
+            for acq, fn in zip(self.acquisitions, function.functions)
+        )
+        return function
+
+    def prepare_acquisition_function_batched(
+        self,
+        models: Sequence[Mapping[str, ProbabilisticModel]],
+        datasets: Optional[Sequence[Mapping[str, Dataset]]] = None,
+    ) -> AcquisitionFunction:
+        r"""
+        Return an acquisition function over a number of independent tasks. This prepares a
+        batched acquisition function for each of the constituent
+        :class:`~trieste.acquisition.AcquisitionFunctionBuilder`\ s, then reduces their outputs
+        for all the tasks at once.
+
+        :param models: The models for each tag, for each task.
+        :param datasets: The data from the observer for each task (optional).
+        :return: The reduced acquisition function over all the tasks.
+        """
+        functions = tuple(
+            acq.prepare_acquisition_function_batched(models, datasets=datasets)
+            for acq in self.acquisitions
+        )
 
         def evaluate_acquisition_function_fn(at: TensorType) -> TensorType:
             return self._reduce_acquisition_functions(at, functions)
 
         return evaluate_acquisition_function_fn
 
-    # TODO: define update_acquisition_function to avoid unnecessary retracing
-
     @property
     def acquisitions(self) -> Sequence[AcquisitionFunctionBuilder]:
         """The acquisition function builders specified at class initialisation."""
@@ -93,6 +138,28 @@ class Reducer(AcquisitionFunctionBuilder):
         raise NotImplementedError()
 
 
+class _ReducedAcquisitionFunction(AcquisitionFunctionClass):
+    """
+    The acquisition function built by a :class:`Reducer`. It holds its own constituent acquisition
+    functions, so that updating it doesn't affect any other function built by the same builder.
+    """
+
+    def __init__(
+        self,
+        reduce: Callable[[TensorType, Sequence[AcquisitionFunction]], TensorType],
+        functions: Sequence[AcquisitionFunction],
+    ):
+        """
+        :param reduce: Evaluates the constituent acquisition functions and reduces their outputs.
+        :param functions: The constituent acquisition functions.
+        """
+        self._reduce = reduce
+        self.functions = tuple(functions)
+
+    def __call__(self, x: TensorType) -> TensorType:
+        return self._reduce(x, self.functions)
+
+
 class Sum(Reducer):
     """
     :class:`Reducer` whose resulting acquisition function returns the element-wise sum of the
@@ -12,41 +12,115 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """ This folder contains single-objective optimization functions. """
-from .active_learning import (
-    ExpectedFeasibility,
-    PredictiveVariance,
-    bichon_ranjan_criterion,
-    predictive_variance,
-)
-from .entropy import (
-    GIBBON,
-    MinValueEntropySearch,
-    gibbon_quality_term,
-    gibbon_repulsion_term,
-    min_value_entropy_search,
-)
-from .function import (
-    AugmentedExpectedImprovement,
-    BatchMonteCarloExpectedImprovement,
-    ExpectedConstrainedImprovement,
-    ExpectedImprovement,
-    NegativeLowerConfidenceBound,
-    NegativePredictiveMean,
-    ProbabilityOfFeasibility,
-    augmented_expected_improvement,
-    expected_improvement,
-    lower_confidence_bound,
-    probability_of_feasibility,
-)
-from .local_penalization import (
-    LocalPenalizationAcquisitionFunction,
-    hard_local_penalizer,
-    soft_local_penalizer,
-)
-from .multi_objective import (
-    BatchMonteCarloExpectedHypervolumeImprovement,
-    ExpectedConstrainedHypervolumeImprovement,
-    ExpectedHypervolumeImprovement,
-    batch_ehvi,
-    expected_hv_improvement,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .active_learning import (
+        ExpectedFeasibility,
+        PredictiveVariance,
+        bichon_ranjan_criterion,
+        predictive_variance,
+    )
+    from .entropy import (
+        GIBBON,
+        MinValueEntropySearch,
+        gibbon_quality_term,
+        gibbon_repulsion_term,
+        min_value_entropy_search,
+    )
+    from .function import (
+        AugmentedExpectedImprovement,
+        BatchMonteCarloExpectedImprovement,
+        ExpectedConstrainedImprovement,
+        ExpectedImprovement,
+        NegativeLowerConfidenceBound,
+        NegativePredictiveMean,
+        ProbabilityOfFeasibility,
+        augmented_expected_improvement,
+        expected_improvement,
+        lower_confidence_bound,
+        probability_of_feasibility,
+    )
+    from .local_penalization import (
+        LocalPenalizationAcquisitionFunction,
+        hard_local_penalizer,
+        soft_local_penalizer,
+    )
+    from .multi_objective import (
+        BatchMonteCarloExpectedHypervolumeImprovement,
+        ExpectedConstrainedHypervolumeImprovement,
+        ExpectedHypervolumeImprovement,
+        batch_ehvi,
+        expected_hv_improvement,
+    )
+
+_SUBMODULE_EXPORTS: dict[str, tuple[str, ...]] = {
+    "active_learning": (
+        "ExpectedFeasibility",
+        "PredictiveVariance",
+        "bichon_ranjan_criterion",
+        "predictive_variance",
+    ),
+    "entropy": (
+        "GIBBON",
+        "MinValueEntropySearch",
+        "gibbon_quality_term",
+        "gibbon_repulsion_term",
+        "min_value_entropy_search",
+    ),
+    "function": (
+        "AugmentedExpectedImprovement",
+        "BatchMonteCarloExpectedImprovement",
+        "ExpectedConstrainedImprovement",
+        "ExpectedImprovement",
+        "NegativeLowerConfidenceBound",
+        "NegativePredictiveMean",
+        "ProbabilityOfFeasibility",
+        "augmented_expected_improvement",
+        "expected_improvement",
+        "lower_confidence_bound",
+        "probability_of_feasibility",
+    ),
+    "local_penalization": (
+        "LocalPenalizationAcquisitionFunction",
+        "hard_local_penalizer",
+        "soft_local_penalizer",
+    ),
+    "multi_objective": (
+        "BatchMonteCarloExpectedHypervolumeImprovement",
+        "ExpectedConstrainedHypervolumeImprovement",
+        "ExpectedHypervolumeImprovement",
+        "batch_ehvi",
+        "expected_hv_improvement",
+    ),
+}
+
+_EXPORT_SUBMODULES = {
+    name: submodule for submodule, names in _SUBMODULE_EXPORTS.items() for name in names
+}
+
+__all__ = sorted(_EXPORT_SUBMODULES)
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the acquisition function ``name`` from its submodule on first access, so that importing
+    this package doesn't load every acquisition function submodule.
+
+    :param name: The attribute name.
+    :return: The attribute.
+    :raise AttributeError: If this package doesn't export ``name``.
+    """
+    if name not in _EXPORT_SUBMODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{_EXPORT_SUBMODULES[name]}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
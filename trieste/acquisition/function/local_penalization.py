@@ -208,7 +208,7 @@ class LocalPenalizationAcquisitionFunction(SingleModelGreedyAcquisitionBuilder):
 
         lipschitz_constant, eta = self._get_lipschitz_estimate(model, samples)
         if lipschitz_constant < 1e-5:  # threshold to improve numerical stability for 'flat' models
-            lipschitz_constant = 10
+            lipschitz_constant = tf.constant(10, dtype=lipschitz_constant.dtype)
 
         self._lipschitz_constant = lipschitz_constant
         self._eta = eta
@@ -268,6 +268,11 @@ class local_penalizer(UpdatablePenalizationFunction):
         eta: TensorType,
     ) -> None:
         """Update the local penalizer with new variable values."""
+        # convert any python or numpy values up front, so they don't cause downstream retracing
+        pending_points = tf.convert_to_tensor(pending_points, dtype=self._pending_points.dtype)
+        lipschitz_constant = tf.convert_to_tensor(lipschitz_constant, dtype=self._radius.dtype)
+        eta = tf.convert_to_tensor(eta, dtype=self._radius.dtype)
+
         mean_pending, variance_pending = self._model.predict(pending_points)
         self._pending_points.assign(pending_points)
         self._radius.assign(tf.transpose((mean_pending - eta) / lipschitz_constant))
@@ -17,8 +17,12 @@ the utility of evaluating sets of candidate points.
 """
 from __future__ import annotations
 
+import operator
+import sys
 from abc import ABC, abstractmethod
-from typing import Callable, Mapping, Optional
+from typing import Callable, Mapping, Optional, Sequence
+
+import tensorflow as tf
 
 from ..data import Dataset
 from ..models import ProbabilisticModel
@@ -31,7 +35,9 @@ Type alias for acquisition functions.
 An :const:`AcquisitionFunction` maps a set of `B` query points (each of dimension `D`) to a single
 value that describes how useful it would be evaluate all these points together (to our goal of
 optimizing the objective function). Thus, with leading dimensions, an :const:`AcquisitionFunction`
-takes input shape `[..., B, D]` and returns shape `[..., 1]`.
+takes input shape `[..., B, D]` and returns shape `[..., 1]`. The leading dimensions can be
+arbitrary, and each set of `B` points is evaluated independently. Acquisition optimizers rely on
+this to evaluate many candidates, or many optimization restarts, in a single call.
 
 Note that :const:`AcquisitionFunction`s which do not support batch optimization still expect inputs
 with a batch dimension, i.e. an input of shape `[..., 1, D]`.
@@ -48,6 +54,30 @@ class AcquisitionFunctionClass(ABC):
     def __call__(self, x: TensorType) -> TensorType:
         """Call acquisition function."""
 
+    def get_concrete_function(self, input_spec: tf.TensorSpec) -> AcquisitionFunction:
+        """
+        Trace the acquisition function for inputs matching ``input_spec``, for subclasses whose
+        :meth:`__call__` is decorated with `@tf.function`. The traced function is cached on the
+        instance, so calling this again with the same spec returns it without any further
+        signature matching or tracing. Since it reads the same variables as :meth:`__call__`, it
+        remains valid across any updates that assign to those variables. The continuous
+        acquisition optimizer uses this to trace the acquisition function once per optimization.
+
+        :param input_spec: The shape and dtype of the query points, e.g.
+            ``tf.TensorSpec([None, 1, D], tf.float64)``.
+        :return: The acquisition function traced for ``input_spec``.
+        :raise ValueError: If :meth:`__call__` is not a `tf.function`.
+        """
+        concrete_functions = self.__dict__.setdefault("_concrete_functions", {})
+        if input_spec not in concrete_functions:
+            trace = getattr(self.__call__, "get_concrete_function", None)
+            if trace is None:
+                raise ValueError(
+                    f"Can't trace {type(self).__name__}, as its __call__ is not a tf.function."
+                )
+            concrete_functions[input_spec] = trace(input_spec)
+        return concrete_functions[input_spec]
+
 
 class AcquisitionFunctionBuilder(ABC):
     """An :class:`AcquisitionFunctionBuilder` builds and updates an acquisition function."""
@@ -86,6 +116,53 @@ class AcquisitionFunctionBuilder(ABC):
         """
         return self.prepare_acquisition_function(models, datasets=datasets)
 
+    def prepare_acquisition_function_batched(
+        self,
+        models: Sequence[Mapping[str, ProbabilisticModel]],
+        datasets: Optional[Sequence[Mapping[str, Dataset]]] = None,
+    ) -> AcquisitionFunction:
+        """
+        Prepare a single acquisition function for a number of independent tasks, such as
+        different problems or random seeds, each with its own models and data. The resulting
+        acquisition function takes input shape `[T, ..., B, D]` for `T` tasks, and returns shape
+        `[T, ..., 1]`, where the `t`-th slice along the leading dimension is evaluated with the
+        acquisition function for the `t`-th task.
+
+        By default this prepares a separate acquisition function for each task, with
+        :meth:`prepare_acquisition_function`, and stacks their outputs. This is only valid if the
+        functions returned by :meth:`prepare_acquisition_function` don't share any state. Builders
+        that keep state between calls, or that can evaluate all the tasks with a single batched
+        model call, should override this method.
+
+        :param models: The models for each tag, for each task.
+        :param datasets: The data from the observer for each task (optional).
+        :return: An acquisition function over all the tasks.
+        :raise tf.errors.InvalidArgumentError: If there are no tasks, or ``datasets`` doesn't
+            have an entry for each task.
+        """
+        tf.debugging.assert_positive(len(models), message="At least one task expected, got none.")
+        if datasets is not None:
+            tf.debugging.assert_equal(
+                len(datasets), len(models), message="Expected one set of datasets per task."
+            )
+
+        functions = [
+            self.prepare_acquisition_function(
+                task_models, datasets=None if datasets is None else datasets[t]
+            )
+            for t, task_models in enumerate(models)
+        ]
+
+        def batched_acquisition_function(x: TensorType) -> TensorType:
+            tf.debugging.assert_equal(
+                tf.shape(x)[0],
+                len(functions),
+                message="The leading dimension of the input must match the number of tasks.",
+            )
+            return tf.stack([function(x[t]) for t, function in enumerate(functions)])
+
+        return batched_acquisition_function
+
 
 class SingleModelAcquisitionBuilder(ABC):
     """
@@ -99,32 +176,7 @@ class SingleModelAcquisitionBuilder(ABC):
         :return: An acquisition function builder that selects the model and dataset specified by
             ``tag``, as defined in :meth:`prepare_acquisition_function`.
         """
-        single_builder = self
-
-        class _Anon(AcquisitionFunctionBuilder):
-            def prepare_acquisition_function(
-                self,
-                models: Mapping[str, ProbabilisticModel],
-                datasets: Optional[Mapping[str, Dataset]] = None,
-            ) -> AcquisitionFunction:
-                return single_builder.prepare_acquisition_function(
-                    models[tag], dataset=None if datasets is None else datasets[tag]
-                )
-
-            def update_acquisition_function(
-                self,
-                function: AcquisitionFunction,
-                models: Mapping[str, ProbabilisticModel],
-                datasets: Optional[Mapping[str, Dataset]] = None,
-            ) -> AcquisitionFunction:
-                return single_builder.update_acquisition_function(
-                    function, models[tag], dataset=None if datasets is None else datasets[tag]
-                )
-
-            def __repr__(self) -> str:
-                return f"{single_builder!r} using tag {tag!r}"
-
-        return _Anon()
+        return _TaggedSingleModelAdapter(self, tag)
 
     @abstractmethod
     def prepare_acquisition_function(
@@ -153,6 +205,46 @@ class SingleModelAcquisitionBuilder(ABC):
         return self.prepare_acquisition_function(model, dataset=dataset)
 
 
+class _TaggedSingleModelAdapter(AcquisitionFunctionBuilder):
+    """
+    An :class:`AcquisitionFunctionBuilder` that builds an acquisition function with a
+    :class:`SingleModelAcquisitionBuilder`, from the model and dataset with a given tag.
+    """
+
+    def __init__(self, single_builder: SingleModelAcquisitionBuilder, tag: str):
+        """
+        :param single_builder: The single model acquisition function builder.
+        :param tag: The tag for the model, dataset pair to use to build the acquisition function.
+        """
+        self._single_builder = single_builder
+        self._tag = sys.intern(tag)
+        self._select = operator.itemgetter(self._tag)
+
+    def prepare_acquisition_function(
+        self,
+        models: Mapping[str, ProbabilisticModel],
+        datasets: Optional[Mapping[str, Dataset]] = None,
+    ) -> AcquisitionFunction:
+        return self._single_builder.prepare_acquisition_function(
+            self._select(models), dataset=None if datasets is None else self._select(datasets)
+        )
+
+    def update_acquisition_function(
+        self,
+        function: AcquisitionFunction,
+        models: Mapping[str, ProbabilisticModel],
+        datasets: Optional[Mapping[str, Dataset]] = None,
+    ) -> AcquisitionFunction:
+        return self._single_builder.update_acquisition_function(
+            function,
+            self._select(models),
+            dataset=None if datasets is None else self._select(datasets),
+        )
+
+    def __repr__(self) -> str:
+        return f"{self._single_builder!r} using tag {self._tag!r}"
+
+
 class GreedyAcquisitionFunctionBuilder(ABC):
     """
     A :class:`GreedyAcquisitionFunctionBuilder` builds an acquisition function
@@ -204,7 +296,9 @@ class GreedyAcquisitionFunctionBuilder(ABC):
             where M is the number of pending points and D is the search space dimension.
         :param new_optimization_step: Indicates whether this call to update_acquisition_function
             is to start of a new optimization step, of to continue collecting batch of points
-            for the current step. Defaults to ``True``.
+            for the current step. Defaults to ``True``. If ``False``, the ``models`` and
+            ``datasets`` are unchanged since the previous call, so any quantities derived from
+            them alone (such as a Cholesky factor of the model's kernel matrix) can be reused.
         :return: The updated acquisition function.
         """
         return self.prepare_acquisition_function(
@@ -224,41 +318,7 @@ class SingleModelGreedyAcquisitionBuilder(ABC):
         :return: An acquisition function builder that selects the model and dataset specified by
             ``tag``, as defined in :meth:`prepare_acquisition_function`.
         """
-        single_builder = self
-
-        class _Anon(GreedyAcquisitionFunctionBuilder):
-            def prepare_acquisition_function(
-                self,
-                models: Mapping[str, ProbabilisticModel],
-                datasets: Optional[Mapping[str, Dataset]] = None,
-                pending_points: Optional[TensorType] = None,
-            ) -> AcquisitionFunction:
-                return single_builder.prepare_acquisition_function(
-                    models[tag],
-                    dataset=None if datasets is None else datasets[tag],
-                    pending_points=pending_points,
-                )
-
-            def update_acquisition_function(
-                self,
-                function: AcquisitionFunction,
-                models: Mapping[str, ProbabilisticModel],
-                datasets: Optional[Mapping[str, Dataset]] = None,
-                pending_points: Optional[TensorType] = None,
-                new_optimization_step: bool = True,
-            ) -> AcquisitionFunction:
-                return single_builder.update_acquisition_function(
-                    function,
-                    models[tag],
-                    dataset=None if datasets is None else datasets[tag],
-                    pending_points=pending_points,
-                    new_optimization_step=new_optimization_step,
-                )
-
-            def __repr__(self) -> str:
-                return f"{single_builder!r} using tag {tag!r}"
-
-        return _Anon()
+        return _TaggedSingleModelGreedyAdapter(self, tag)
 
     @abstractmethod
     def prepare_acquisition_function(
@@ -291,7 +351,9 @@ class SingleModelGreedyAcquisitionBuilder(ABC):
             where M is the number of pending points and D is the search space dimension.
         :param new_optimization_step: Indicates whether this call to update_acquisition_function
             is to start of a new optimization step, of to continue collecting batch of points
-            for the current step. Defaults to ``True``.
+            for the current step. Defaults to ``True``. If ``False``, the ``model`` and
+            ``dataset`` are unchanged since the previous call, so any quantities derived from
+            them alone (such as a Cholesky factor of the model's kernel matrix) can be reused.
         :return: The updated acquisition function.
         """
         return self.prepare_acquisition_function(
@@ -301,6 +363,53 @@ class SingleModelGreedyAcquisitionBuilder(ABC):
         )
 
 
+class _TaggedSingleModelGreedyAdapter(GreedyAcquisitionFunctionBuilder):
+    """
+    A :class:`GreedyAcquisitionFunctionBuilder` that builds an acquisition function with a
+    :class:`SingleModelGreedyAcquisitionBuilder`, from the model and dataset with a given tag.
+    """
+
+    def __init__(self, single_builder: SingleModelGreedyAcquisitionBuilder, tag: str):
+        """
+        :param single_builder: The single model greedy acquisition function builder.
+        :param tag: The tag for the model, dataset pair to use to build the acquisition function.
+        """
+        self._single_builder = single_builder
+        self._tag = sys.intern(tag)
+        self._select = operator.itemgetter(self._tag)
+
+    def prepare_acquisition_function(
+        self,
+        models: Mapping[str, ProbabilisticModel],
+        datasets: Optional[Mapping[str, Dataset]] = None,
+        pending_points: Optional[TensorType] = None,
+    ) -> AcquisitionFunction:
+        return self._single_builder.prepare_acquisition_function(
+            self._select(models),
+            dataset=None if datasets is None else self._select(datasets),
+            pending_points=pending_points,
+        )
+
+    def update_acquisition_function(
+        self,
+        function: AcquisitionFunction,
+        models: Mapping[str, ProbabilisticModel],
+        datasets: Optional[Mapping[str, Dataset]] = None,
+        pending_points: Optional[TensorType] = None,
+        new_optimization_step: bool = True,
+    ) -> AcquisitionFunction:
+        return self._single_builder.update_acquisition_function(
+            function,
+            self._select(models),
+            dataset=None if datasets is None else self._select(datasets),
+            pending_points=pending_points,
+            new_optimization_step=new_optimization_step,
+        )
+
+    def __repr__(self) -> str:
+        return f"{self._single_builder!r} using tag {self._tag!r}"
+
+
 PenalizationFunction = Callable[[TensorType], TensorType]
 """
 An :const:`PenalizationFunction` maps a query point (of dimension `D`) to a single
@@ -314,11 +423,20 @@ shape `[..., 1, D]` and returns shape `[..., 1]`.
 
 class UpdatablePenalizationFunction(ABC):
     """An :class:`UpdatablePenalizationFunction` builds and updates a penalization function.
-    Defining a penalization function that can be updated avoids having to retrace on every call."""
+    Defining a penalization function that can be updated avoids having to retrace on every call.
+
+    A single call evaluates the penalization from all the pending points at once, so
+    implementations should hold the pending points (and any quantities derived from them) in
+    variables with an unknown leading dimension, and compute the penalization as one reduction
+    over that dimension rather than one call per pending point."""
 
     @abstractmethod
     def __call__(self, x: TensorType) -> TensorType:
-        """Call penalization function.."""
+        """Call penalization function.
+
+        :param x: The query points, with shape `[..., 1, D]`.
+        :return: The combined penalization from all the pending points, with shape `[..., 1]`.
+        """
 
     @abstractmethod
     def update(
@@ -19,7 +19,6 @@ This module contains functionality for optimizing
 
 from __future__ import annotations
 
-import copy
 from typing import Any, Callable, TypeVar
 
 import gpflow
@@ -29,7 +28,7 @@ from scipy.optimize import OptimizeResult
 
 from ..space import Box, DiscreteSearchSpace, SearchSpace, TaggedProductSearchSpace
 from ..types import TensorType
-from .interface import AcquisitionFunction
+from .interface import AcquisitionFunction, AcquisitionFunctionClass
 
 SP = TypeVar("SP", bound=SearchSpace)
 """ Type variable bound to :class:`~trieste.space.SearchSpace`. """
@@ -51,6 +50,15 @@ determining the number of initial samples in the multi-start acquisition functio
 """
 
 
+NUM_EVALUATIONS_PER_CHUNK: int = 2 ** 16
+"""
+The default maximum number of candidate points at which the acquisition optimizers evaluate an
+acquisition function in a single call. Larger sets of candidates, such as the initial samples or
+the points of a :class:`~trieste.space.DiscreteSearchSpace`, are evaluated in chunks of this size,
+to bound the memory used by acquisition functions with large intermediate tensors.
+"""
+
+
 class FailedOptimizationError(Exception):
     """Raised when an acquisition optimizer fails to optimize"""
 
@@ -103,7 +111,7 @@ def optimize_discrete(space: DiscreteSearchSpace, target_func: AcquisitionFuncti
             [..., 1].
     :return: The **one** point in ``space`` that maximises ``target_func``, with shape [1, D].
     """
-    target_func_values = target_func(space.points[:, None, :])
+    target_func_values = _evaluate_in_chunks(target_func, space.points[:, None, :])
     tf.debugging.assert_shapes(
         [(target_func_values, ("_", 1))],
         message=(
@@ -120,6 +128,7 @@ def generate_continuous_optimizer(
     num_optimization_runs: int = 1,
     num_recovery_runs: int = 5,
     optimizer_args: dict[str, Any] = dict(),
+    num_evaluations_per_chunk: int = NUM_EVALUATIONS_PER_CHUNK,
 ) -> AcquisitionOptimizer[Box | TaggedProductSearchSpace]:
     """
     Generate a gradient-based optimizer for :class:'Box' and :class:'TaggedProductSearchSpace'
@@ -135,6 +144,11 @@ def generate_continuous_optimizer(
 
     For challenging acquisition function optimizations, we run `num_optimization_runs` separate
     optimizations, each starting from one of the top `num_optimization_runs` initial query points.
+    These optimizations are first run together, as a single L-BFGS-B optimization over all the
+    starting points, so that the acquisition function is evaluated for all of them in one (batched)
+    call. This shares a line search and a convergence test between the runs. If this joint
+    optimization fails, e.g. because a single run diverges, each run is repeated on its own, and
+    the best of the successful runs is chosen.
 
     If all `num_optimization_runs` optimizations fail to converge then we run up to
     `num_recovery_runs` starting from random locations.
@@ -151,6 +165,8 @@ def generate_continuous_optimizer(
     :param optimizer_args: The keyword arguments to pass to the GPflow's Scipy optimizer wrapper.
         Check `minimize` method  of :class:`~gpflow.optimizers.Scipy` for details what arguments
         can be passed.
+    :param num_evaluations_per_chunk: The maximum number of initial samples at which to evaluate
+        the acquisition function in a single call.
     :return: The acquisition optimizer.
     """
     if num_initial_samples <= 0:
@@ -170,6 +186,11 @@ def generate_continuous_optimizer(
     if num_recovery_runs <= -1:
         raise ValueError(f"num_recovery_runs must be zero or greater, got {num_recovery_runs}")
 
+    if num_evaluations_per_chunk <= 0:
+        raise ValueError(
+            f"num_evaluations_per_chunk must be positive, got {num_evaluations_per_chunk}"
+        )
+
     def optimize_continuous(
         space: Box | TaggedProductSearchSpace, target_func: AcquisitionFunction
     ) -> TensorType:
@@ -191,66 +212,77 @@ def generate_continuous_optimizer(
         """
 
         trial_search_space = space.sample(num_initial_samples)  # [num_initial_samples, D]
-        target_func_values = target_func(trial_search_space[:, None, :])  # [num_samples, 1]
+        target_func = _traced_for(target_func, trial_search_space[:, None, :])
+        target_func_values = _evaluate_in_chunks(
+            target_func, trial_search_space[:, None, :], num_evaluations_per_chunk
+        )  # [num_samples, 1]
         _, top_k_indicies = tf.math.top_k(
             target_func_values[:, 0], k=num_optimization_runs
         )  # [num_optimization_runs]
         initial_points = tf.gather(trial_search_space, top_k_indicies)  # [num_optimization_runs, D]
 
-        variable = tf.Variable(initial_points[0:1])  # [1, D]
-        optimizer_args_local = copy.deepcopy(optimizer_args)
-
-        def _objective() -> TensorType:
-            return -target_func(variable[:, None, :])  # [1]
+        # only the top-level "bounds" entry is overwritten below, so a shallow copy is enough to
+        # leave the caller's arguments untouched, and avoids copying (e.g.) user callbacks
+        optimizer_args_local = dict(optimizer_args)
 
         def _perform_optimization(
-            starting_point: TensorType,
-            optimizer_args: dict[str, Any],
-        ) -> OptimizeResult:
-            variable.assign(starting_point)  # [1, D]
-            return gpflow.optimizers.Scipy().minimize(_objective, (variable,), **optimizer_args)
-
-        successful_optimization = False
-        chosen_point = variable  # [1, D]
-        chosen_point_score = target_func(chosen_point[:, None, :])  # [1, 1]
-
-        for i in tf.range(
-            num_optimization_runs
-        ):  # perform optimization for each chosen starting point
+            starting_points: TensorType,
+        ) -> tuple[OptimizeResult, tf.Variable]:
+            # optimize from all the starting points [R, D] at once. Since the acquisition function
+            # values at each point are independent, maximizing their sum maximizes each of them,
+            # and the acquisition function need only be evaluated once per step, on shape [R, 1, D]
+            variable = tf.Variable(starting_points)  # [R, D]
+
             if isinstance(space, TaggedProductSearchSpace):
-                bounds = get_bounds_of_box_relaxation_around_point(space, initial_points[i : i + 1])
+                bounds = [
+                    get_bounds_of_box_relaxation_around_point(space, starting_points[i : i + 1])
+                    for i in range(len(starting_points))
+                ]
+                lower = tf.concat([b.lb for b in bounds], axis=-1)  # [R * D]
+                upper = tf.concat([b.ub for b in bounds], axis=-1)  # [R * D]
             else:
-                bounds = spo.Bounds(space.lower, space.upper)
-            optimizer_args_local["bounds"] = bounds
-            opt_result = _perform_optimization(initial_points[i : i + 1], optimizer_args_local)
-            if opt_result.success:
-                successful_optimization = True
-
-                new_point = variable  # [1, D]
-                new_point_score = -opt_result.fun  # [1, 1]
-
-                if new_point_score > chosen_point_score:  # if found a better point then keep
-                    chosen_point = new_point  # [1, D]
-                    chosen_point_score = new_point_score  # [1, 1]
-
-        if not successful_optimization:  # if all optimizations failed then try from random start
+                lower = tf.tile(space.lower, [len(starting_points)])  # [R * D]
+                upper = tf.tile(space.upper, [len(starting_points)])  # [R * D]
+            optimizer_args_local["bounds"] = spo.Bounds(lower, upper)
+
+            def _objective() -> TensorType:
+                return -tf.reduce_sum(target_func(variable[:, None, :]))  # []
+
+            result = gpflow.optimizers.Scipy().minimize(
+                _objective, (variable,), **optimizer_args_local
+            )
+            return result, variable
+
+        opt_result, variable = _perform_optimization(initial_points)
+
+        if opt_result.success:
+            successful_points = [variable]
+        else:
+            # a single run that fails (e.g. diverges) fails the joint optimization, so repeat each
+            # run on its own, with its own convergence test, and keep those that succeed
+            successful_points = []
+            if num_optimization_runs > 1:
+                for i in range(num_optimization_runs):
+                    opt_result, variable = _perform_optimization(initial_points[i : i + 1])
+                    if opt_result.success:
+                        successful_points.append(variable)
+
+        if successful_points:
+            points = tf.concat(successful_points, axis=0)  # [num_successful_runs, D]
+            scores = target_func(points[:, None, :])[:, 0]  # [num_successful_runs]
+            best_index = tf.argmax(scores)
+            chosen_point = points[best_index : best_index + 1]  # [1, D]
+        else:  # if all the optimizations failed then try from random starts
             for i in tf.range(num_recovery_runs):
-                random_start = space.sample(1)
-                if isinstance(space, TaggedProductSearchSpace):
-                    bounds = get_bounds_of_box_relaxation_around_point(space, random_start)
-                else:
-                    bounds = spo.Bounds(space.lower, space.upper)
-                optimizer_args_local["bounds"] = bounds
-                opt_result = _perform_optimization(random_start, optimizer_args_local)
+                opt_result, variable = _perform_optimization(space.sample(1))
                 if opt_result.success:
                     chosen_point = variable  # [1, D]
-                    successful_optimization = True
                     break
-            if not successful_optimization:  # return error if still failed
+            else:  # return error if still failed
                 raise FailedOptimizationError(
                     f"""
-                    Acquisition function optimization failed,
-                    even after {num_recovery_runs + num_optimization_runs} restarts.
+                    Acquisition function optimization failed from all {num_optimization_runs}
+                    starting points, and in {num_recovery_runs} recovery runs.
                     """
                 )
 
@@ -320,6 +352,7 @@ def batchify(
 
 def generate_random_search_optimizer(
     num_samples: int = NUM_SAMPLES_MIN,
+    num_evaluations_per_chunk: int = NUM_EVALUATIONS_PER_CHUNK,
 ) -> AcquisitionOptimizer[SP]:
     """
     Generate an acquisition optimizer that samples `num_samples` random points across the space.
@@ -329,11 +362,18 @@ def generate_random_search_optimizer(
     `NUM_SAMPLES_DIM` times the dimensionality of the search space, whichever is smaller.
 
     :param num_samples: The number of random points to sample.
+    :param num_evaluations_per_chunk: The maximum number of samples at which to evaluate the
+        acquisition function in a single call.
     :return: The acquisition optimizer.
     """
     if num_samples <= 0:
         raise ValueError(f"num_samples must be positive, got {num_samples}")
 
+    if num_evaluations_per_chunk <= 0:
+        raise ValueError(
+            f"num_evaluations_per_chunk must be positive, got {num_evaluations_per_chunk}"
+        )
+
     def optimize_random(space: SP, target_func: AcquisitionFunction) -> TensorType:
         """
         A random search :const:`AcquisitionOptimizer` defined for
@@ -347,8 +387,59 @@ def generate_random_search_optimizer(
         :return: The **one** point in ``space`` that maximises ``target_func``, with shape [1, D].
         """
         samples = space.sample(num_samples)
-        target_func_values = target_func(samples[:, None, :])
+        target_func_values = _evaluate_in_chunks(
+            target_func, samples[:, None, :], num_evaluations_per_chunk
+        )
         max_value_idx = tf.argmax(target_func_values, axis=0)[0]
         return samples[max_value_idx : max_value_idx + 1]
 
     return optimize_random
+
+
+def _evaluate_in_chunks(
+    target_func: AcquisitionFunction,
+    points: TensorType,
+    num_evaluations_per_chunk: int = NUM_EVALUATIONS_PER_CHUNK,
+) -> TensorType:
+    """
+    Evaluate ``target_func`` at ``points``, in chunks of at most ``num_evaluations_per_chunk``
+    points along the leading dimension.
+
+    :param target_func: The function to evaluate, with input shape [..., B, D] and output shape
+        [..., 1].
+    :param points: The points at which to evaluate ``target_func``, with shape [N, B, D].
+    :param num_evaluations_per_chunk: The maximum number of points to evaluate in a single call.
+    :return: The values of ``target_func`` at ``points``, with shape [N, 1].
+    """
+    num_points = points.shape[0]
+    if num_points <= num_evaluations_per_chunk:
+        return target_func(points)
+
+    return tf.concat(
+        [
+            target_func(points[i : i + num_evaluations_per_chunk])
+            for i in range(0, num_points, num_evaluations_per_chunk)
+        ],
+        axis=0,
+    )
+
+
+def _traced_for(target_func: AcquisitionFunction, points: TensorType) -> AcquisitionFunction:
+    """
+    Trace ``target_func`` once for inputs shaped like ``points`` (with any leading dimension), if
+    it's an :class:`~trieste.acquisition.AcquisitionFunctionClass` whose `__call__` is a
+    `tf.function`, so that the many calls made while optimizing it skip `tf.function`'s signature
+    matching.
+
+    :param target_func: The acquisition function.
+    :param points: Example input points, with shape [N, B, D].
+    :return: The traced ``target_func`` if it can be traced, else ``target_func`` itself.
+    """
+    if isinstance(target_func, AcquisitionFunctionClass) and hasattr(
+        target_func.__call__, "get_concrete_function"
+    ):
+        return target_func.get_concrete_function(
+            tf.TensorSpec([None, *points.shape[1:]], points.dtype)
+        )
+
+    return target_func
@@ -32,7 +32,6 @@ from ..models import ProbabilisticModel
 from ..observer import OBJECTIVE
 from ..space import Box, SearchSpace
 from ..types import State, TensorType
-from .function import BatchMonteCarloExpectedImprovement, ExpectedImprovement
 from .interface import (
     AcquisitionFunction,
     AcquisitionFunctionBuilder,
@@ -143,6 +142,10 @@ class EfficientGlobalOptimization(AcquisitionRule[TensorType, SP_contra]):
 
         if builder is None:
             if num_query_points == 1:
+                # imported here, so that importing this module doesn't load the acquisition
+                # functions unless the default builder is actually used
+                from .function import ExpectedImprovement
+
                 builder = ExpectedImprovement()
             else:
                 raise ValueError(
@@ -367,6 +370,10 @@ class AsynchronousOptimization(
             )
 
         if builder is None:
+            # imported here, so that importing this module doesn't load the acquisition functions
+            # unless the default builder is actually used
+            from .function import BatchMonteCarloExpectedImprovement
+
             builder = BatchMonteCarloExpectedImprovement(10_000)
 
         if optimizer is None:
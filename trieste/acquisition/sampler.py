@@ -23,7 +23,6 @@ from typing import Callable
 
 import tensorflow as tf
 import tensorflow_probability as tfp
-from gpflux.layers.basis_functions import RandomFourierFeatures
 from scipy.optimize import bisect
 
 from ..data import Dataset
@@ -424,6 +423,9 @@ class RandomFourierFeatureThompsonSampler(ThompsonSampler):
             """
             )
 
+        # imported here, so that importing trieste only imports GPflux if it's actually used
+        from gpflux.layers.basis_functions import RandomFourierFeatures
+
         self._feature_functions = RandomFourierFeatures(
             self._kernel, self._num_features, dtype=self._dataset.query_points.dtype
         )  # prep feature functions at data
@@ -486,8 +488,11 @@ class RandomFourierFeatureThompsonSampler(ThompsonSampler):
         G = tf.matmul(phi, phi, transpose_b=True)  # [n, n]
         s = self._noise_variance * tf.eye(self._num_data, dtype=phi.dtype)
         L = tf.linalg.cholesky(G + s)
-        L_inv_phi = tf.linalg.triangular_solve(L, phi)  # [n, m]
-        L_inv_y = tf.linalg.triangular_solve(L, self._dataset.observations)  # [n, 1]
+        # solve for the features and the observations together with a single triangular solve
+        L_inv_phi_y = tf.linalg.triangular_solve(
+            L, tf.concat([phi, self._dataset.observations], axis=-1)
+        )  # [n, m + 1]
+        L_inv_phi, L_inv_y = L_inv_phi_y[:, :-1], L_inv_phi_y[:, -1:]  # [n, m], [n, 1]
 
         theta_posterior_mean = tf.tensordot(tf.transpose(L_inv_phi), L_inv_y, [[-1], [-2]])[
             :, 0
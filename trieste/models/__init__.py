@@ -17,6 +17,35 @@ and its trainable subclass :class:`TrainableProbabilisticModel`. It also contain
 creating :class:`TrainableProbabilisticModel`\ s from config.
 """
 
-from . import gpflow, gpflux, optimizer
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from . import gpflow, optimizer
 from .config import ModelConfig, ModelSpec, create_model
 from .interfaces import ModelStack, ProbabilisticModel, TrainableProbabilisticModel
+
+if TYPE_CHECKING:
+    from . import gpflux
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Import the :mod:`~trieste.models.gpflux` subpackage on first access, so that importing
+    :mod:`trieste` doesn't also import GPflux and Keras for users that don't need them.
+
+    :param name: The attribute name.
+    :return: The attribute.
+    :raise AttributeError: If ``name`` isn't a lazily imported subpackage.
+    """
+    if name != "gpflux":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{name}", __name__)
+    globals()[name] = module
+    return module
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), "gpflux"})
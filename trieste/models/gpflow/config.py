@@ -26,6 +26,14 @@ from ..interfaces import TrainableProbabilisticModel
 from ..optimizer import Optimizer
 from .models import GaussianProcessRegression, SparseVariational, VariationalGaussianProcess
 
+_SUPPORTED_MODELS: dict[Any, Callable[[Any, Optimizer], TrainableProbabilisticModel]] = {
+    GPR: GaussianProcessRegression,
+    SGPR: GaussianProcessRegression,
+    VGP: VariationalGaussianProcess,
+    SVGP: SparseVariational,
+}
+""" The GPflow model types supported by :class:`GPflowModelConfig`, and their wrappers. """
+
 
 @dataclass(frozen=True)
 class GPflowModelConfig(ModelConfig):
@@ -39,10 +47,4 @@ class GPflowModelConfig(ModelConfig):
     def supported_models(
         self,
     ) -> dict[Any, Callable[[Any, Optimizer], TrainableProbabilisticModel]]:
-        models_mapping: dict[Any, Callable[[Any, Optimizer], TrainableProbabilisticModel]] = {
-            GPR: GaussianProcessRegression,
-            SGPR: GaussianProcessRegression,
-            VGP: VariationalGaussianProcess,
-            SVGP: SparseVariational,
-        }
-        return models_mapping
+        return _SUPPORTED_MODELS
@@ -15,6 +15,8 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from contextlib import nullcontext
+from typing import ContextManager, Optional
 
 import gpflow
 import tensorflow as tf
@@ -28,12 +30,22 @@ from ..optimizer import Optimizer
 
 
 class GPflowPredictor(ProbabilisticModel, tf.Module, ABC):
-    """A trainable wrapper for a GPflow Gaussian process model."""
+    """
+    A trainable wrapper for a GPflow Gaussian process model.
 
-    def __init__(self, optimizer: Optimizer | None = None):
+    Note that GPflow models use `float64` by default. TensorFlow only runs `float32` matrix
+    multiplications on TF32 tensor cores, so models that can tolerate the lower precision should
+    be built in `float32` (e.g. with :func:`gpflow.config.set_default_float`) to benefit from
+    them. TF32 execution is enabled by default, see
+    :func:`tf.config.experimental.enable_tensor_float_32_execution`.
+    """
+
+    def __init__(self, optimizer: Optimizer | None = None, device: Optional[str] = None):
         """
         :param optimizer: The optimizer with which to train the model. Defaults to
             :class:`~trieste.models.optimizer.Optimizer` with :class:`~gpflow.optimizers.Scipy`.
+        :param device: The device (e.g. ``"/GPU:0"``) on which to make predictions and optimize
+            the model. Defaults to TensorFlow's own device placement.
         """
         super().__init__()
 
@@ -41,6 +53,14 @@ class GPflowPredictor(ProbabilisticModel, tf.Module, ABC):
             optimizer = Optimizer(gpflow.optimizers.Scipy())
 
         self._optimizer = optimizer
+        self._device = device
+
+    def _device_scope(self) -> ContextManager[None]:
+        """
+        :return: A context in which operations are placed on the device specified at
+            :meth:`__init__`, or in which placement is left to TensorFlow if none was specified.
+        """
+        return nullcontext() if self._device is None else tf.device(self._device)
 
     @property
     def optimizer(self) -> Optimizer:
@@ -53,16 +73,20 @@ class GPflowPredictor(ProbabilisticModel, tf.Module, ABC):
         """The underlying GPflow model."""
 
     def predict(self, query_points: TensorType) -> tuple[TensorType, TensorType]:
-        return self.model.predict_f(query_points)
+        with self._device_scope():
+            return self.model.predict_f(query_points)
 
     def predict_joint(self, query_points: TensorType) -> tuple[TensorType, TensorType]:
-        return self.model.predict_f(query_points, full_cov=True)
+        with self._device_scope():
+            return self.model.predict_f(query_points, full_cov=True)
 
     def sample(self, query_points: TensorType, num_samples: int) -> TensorType:
-        return self.model.predict_f_samples(query_points, num_samples)
+        with self._device_scope():
+            return self.model.predict_f_samples(query_points, num_samples)
 
     def predict_y(self, query_points: TensorType) -> tuple[TensorType, TensorType]:
-        return self.model.predict_y(query_points)
+        with self._device_scope():
+            return self.model.predict_y(query_points)
 
     def get_kernel(self) -> gpflow.kernels.Kernel:
         """
@@ -91,7 +115,8 @@ class GPflowPredictor(ProbabilisticModel, tf.Module, ABC):
 
         :param dataset: The data with which to optimize the `model`.
         """
-        self.optimizer.optimize(self.model, dataset)
+        with self._device_scope():
+            self.optimizer.optimize(self.model, dataset)
 
     def log(self) -> None:
         """
@@ -38,7 +38,11 @@ class GaussianProcessRegression(GPflowPredictor, TrainableProbabilisticModel):
     """
 
     def __init__(
-        self, model: GPR | SGPR, optimizer: Optimizer | None = None, num_kernel_samples: int = 10
+        self,
+        model: GPR | SGPR,
+        optimizer: Optimizer | None = None,
+        num_kernel_samples: int = 10,
+        device: Optional[str] = None,
     ):
         """
         :param model: The GPflow model to wrap.
@@ -47,8 +51,10 @@ class GaussianProcessRegression(GPflowPredictor, TrainableProbabilisticModel):
         :param num_kernel_samples: Number of randomly sampled kernels (for each kernel parameter) to
             evaluate before beginning model optimization. Therefore, for a kernel with `p`
             (vector-valued) parameters, we evaluate `p * num_kernel_samples` kernels.
+        :param device: The device on which to make predictions and optimize the model. Defaults
+            to TensorFlow's own device placement.
         """
-        super().__init__(optimizer)
+        super().__init__(optimizer, device)
         self._model = model
 
         if num_kernel_samples <= 0:
@@ -164,23 +170,23 @@ class GaussianProcessRegression(GPflowPredictor, TrainableProbabilisticModel):
 
         :param dataset: The data with which to optimize the `model`.
         """
-
-        num_trainable_params_with_priors_or_constraints = tf.reduce_sum(
-            [
-                tf.size(param)
-                for param in self.model.trainable_parameters
-                if param.prior is not None or isinstance(param.bijector, tfp.bijectors.Sigmoid)
-            ]
-        )
-
-        if (
-            min(num_trainable_params_with_priors_or_constraints, self._num_kernel_samples) >= 1
-        ):  # Find a promising kernel initialization
-            self.find_best_model_initialization(
-                self._num_kernel_samples * num_trainable_params_with_priors_or_constraints
+        with self._device_scope():
+            num_trainable_params_with_priors_or_constraints = tf.reduce_sum(
+                [
+                    tf.size(param)
+                    for param in self.model.trainable_parameters
+                    if param.prior is not None or isinstance(param.bijector, tfp.bijectors.Sigmoid)
+                ]
             )
 
-        self.optimizer.optimize(self.model, dataset)
+            if (
+                min(num_trainable_params_with_priors_or_constraints, self._num_kernel_samples) >= 1
+            ):  # Find a promising kernel initialization
+                self.find_best_model_initialization(
+                    self._num_kernel_samples * num_trainable_params_with_priors_or_constraints
+                )
+
+            self.optimizer.optimize(self.model, dataset)
 
     def find_best_model_initialization(self, num_kernel_samples: int) -> None:
         """
@@ -243,18 +249,22 @@ class SparseVariational(GPflowPredictor, TrainableProbabilisticModel):
     A :class:`TrainableProbabilisticModel` wrapper for a GPflow :class:`~gpflow.models.SVGP`.
     """
 
-    def __init__(self, model: SVGP, optimizer: Optimizer | None = None):
+    def __init__(
+        self, model: SVGP, optimizer: Optimizer | None = None, device: Optional[str] = None
+    ):
         """
         :param model: The underlying GPflow sparse variational model.
         :param optimizer: The optimizer with which to train the model. Defaults to
             :class:`~trieste.models.optimizer.BatchOptimizer` with :class:`~tf.optimizers.Adam` with
             batch size 100.
+        :param device: The device on which to make predictions and optimize the model. Defaults
+            to TensorFlow's own device placement.
         """
 
         if optimizer is None:
             optimizer = BatchOptimizer(tf.optimizers.Adam(), batch_size=100)
 
-        super().__init__(optimizer)
+        super().__init__(optimizer, device)
         self._model = model
 
         # GPflow stores num_data as a number. However, since we want to be able to update it
@@ -297,6 +307,33 @@ class VGPWrapper(VGP, NumDataPropertyMixin):
     it as a property."""
 
 
+@tf.function(experimental_relax_shapes=True)
+def _whitened_variational_parameters(
+    Lnn: TensorType, f_mu: TensorType, f_cov: TensorType, jitter: float
+) -> tuple[TensorType, TensorType]:
+    """
+    Back-transform the mean and covariance of a VGP's posterior at its data to the whitened
+    variational parameters, i.e. compute L⁻¹ f_mu and the Cholesky factor of L⁻¹ f_cov L⁻ᵀ.
+
+    :param Lnn: The Cholesky factor L of the kernel matrix at the data, with shape [N, N].
+    :param f_mu: The posterior mean at the data, with shape [N, L].
+    :param f_cov: The posterior covariance at the data, with shape [L, N, N].
+    :param jitter: The size of the jitter to use when stabilizing the Cholesky decomposition.
+    :return: The new q_mu and q_sqrt, with shapes [N, L] and [L, N, N].
+    """
+    Lnn = Lnn[None]  # [1, N, N], broadcast once and shared by both solves
+    # solve for L⁻¹ f_mu alongside L⁻¹ f_cov, by appending each output's mean as an extra
+    # column of its covariance, so that both need only a single triangular solve
+    f_cov_and_mu = tf.concat([f_cov, tf.transpose(f_mu)[..., None]], axis=-1)  # [L, N, N+1]
+    solved = tf.linalg.triangular_solve(Lnn, f_cov_and_mu)  # [L, N, N+1]
+    tmp = solved[..., :-1]  # [L, N, N], L⁻¹ f_cov
+    new_q_mu = tf.transpose(solved[..., -1])  # [N, L], L⁻¹ f_mu
+    S_v = tf.linalg.triangular_solve(Lnn, tf.linalg.matrix_transpose(tmp))  # [L, N, N]
+    S_v = tf.linalg.set_diag(S_v, tf.linalg.diag_part(S_v) + jitter)
+    new_q_sqrt = tf.linalg.cholesky(S_v)  # [L, N, N]
+    return new_q_mu, new_q_sqrt
+
+
 class VariationalGaussianProcess(GPflowPredictor, TrainableProbabilisticModel):
     r"""
     A :class:`TrainableProbabilisticModel` wrapper for a GPflow :class:`~gpflow.models.VGP`.
@@ -319,6 +356,7 @@ class VariationalGaussianProcess(GPflowPredictor, TrainableProbabilisticModel):
         optimizer: Optimizer | None = None,
         use_natgrads: bool = False,
         natgrad_gamma: Optional[float] = None,
+        device: Optional[str] = None,
     ):
         """
         :param model: The GPflow :class:`~gpflow.models.VGP`.
@@ -329,6 +367,8 @@ class VariationalGaussianProcess(GPflowPredictor, TrainableProbabilisticModel):
             gradient updates. Note that natural gradients requires
             an :class:`~trieste.models.optimizer.Optimizer` optimizer.
         :natgrad_gamma: Gamma parameter for the natural gradient optimizer.
+        :param device: The device on which to make predictions and optimize the model. Defaults
+            to TensorFlow's own device placement.
         :raise ValueError (or InvalidArgumentError): If ``model``'s :attr:`q_sqrt` is not rank 3
             or if attempting to combine natural gradients with a :class:`~gpflow.optimizers.Scipy`
             optimizer.
@@ -338,7 +378,7 @@ class VariationalGaussianProcess(GPflowPredictor, TrainableProbabilisticModel):
         if optimizer is None:
             optimizer = BatchOptimizer(tf.optimizers.Adam(), batch_size=100)
 
-        super().__init__(optimizer)
+        super().__init__(optimizer, device)
         self._model = model
 
         if use_natgrads:
@@ -362,6 +402,12 @@ class VariationalGaussianProcess(GPflowPredictor, TrainableProbabilisticModel):
         self._use_natgrads = use_natgrads
         self._natgrad_gamma = natgrad_gamma
 
+        # the Cholesky factor of the kernel matrix computed in the last update, along with the
+        # query points, jitter and kernel parameter values it was computed for
+        self._update_cholesky_cache: Optional[
+            tuple[TensorType, float, list[TensorType], TensorType]
+        ] = None
+
         # GPflow stores num_data as a number. However, since we want to be able to update it
         # without having to retrace the acquisition functions, put it in a Variable instead.
         # So that the elbo method doesn't fail we also need to turn it into a property.
@@ -403,25 +449,37 @@ class VariationalGaussianProcess(GPflowPredictor, TrainableProbabilisticModel):
         x, y = self.model.data[0].value(), self.model.data[1].value()
         assert_data_is_compatible(dataset, Dataset(x, y))
 
-        f_mu, f_cov = self.model.predict_f(dataset.query_points, full_cov=True)  # [N, L], [L, N, N]
+        # the query points are used by several ops below, so convert them only once
+        query_points = tf.convert_to_tensor(dataset.query_points, dtype=x.dtype)
+
+        f_mu, f_cov = self.model.predict_f(query_points, full_cov=True)  # [N, L], [L, N, N]
 
         # GPflow's VGP model is hard-coded to use the whitened representation, i.e.
         # q_mu and q_sqrt parametrize q(v), and u = f(X) = L v, where L = cholesky(K(X, X))
         # Hence we need to back-transform from f_mu and f_cov to obtain the updated
         # new_q_mu and new_q_sqrt:
-        Knn = model.kernel(dataset.query_points, full_cov=True)  # [N, N]
-        jitter_mat = jitter * tf.eye(len(dataset), dtype=Knn.dtype)
-        Lnn = tf.linalg.cholesky(Knn + jitter_mat)  # [N, N]
-        new_q_mu = tf.linalg.triangular_solve(Lnn, f_mu)  # [N, L]
-        tmp = tf.linalg.triangular_solve(Lnn[None], f_cov)  # [L, N, N], L⁻¹ f_cov
-        S_v = tf.linalg.triangular_solve(Lnn[None], tf.linalg.matrix_transpose(tmp))  # [L, N, N]
-        new_q_sqrt = tf.linalg.cholesky(S_v + jitter_mat)  # [L, N, N]
-
-        model.data[0].assign(dataset.query_points)
+        Knn = self.model.kernel(query_points, full_cov=True)  # [N, N]
+        # add the jitter to the diagonal only, rather than adding a full jitter matrix
+        Knn = tf.linalg.set_diag(Knn, tf.linalg.diag_part(Knn) + jitter)
+        # tf.linalg.cholesky is already a blocked factorization (Eigen on CPU, cuSOLVER on GPU),
+        # so we don't hand large matrices to SciPy, which would also pin this to the CPU and break
+        # tracing through a py_function
+        Lnn = tf.linalg.cholesky(Knn)  # [N, N]
+        new_q_mu, new_q_sqrt = _whitened_variational_parameters(Lnn, f_mu, f_cov, jitter)
+
+        model.data[0].assign(query_points)
         model.data[1].assign(dataset.observations)
-        model.num_data = len(dataset)
-        model.q_mu = gpflow.Parameter(new_q_mu)
-        model.q_sqrt = gpflow.Parameter(new_q_sqrt, transform=gpflow.utilities.triangular())
+        # num_data is held in a Variable (see VGPWrapper), so set it in that Variable's dtype
+        model.num_data = tf.cast(tf.shape(query_points)[0], model.num_data.dtype)
+
+        # assign in place where possible, so that anything that captured the variational
+        # parameters (such as a traced acquisition function) sees the new values without retracing
+        if model.q_mu.shape == new_q_mu.shape:
+            model.q_mu.assign(new_q_mu)
+            model.q_sqrt.assign(new_q_sqrt)
+        else:
+            model.q_mu = gpflow.Parameter(new_q_mu)
+            model.q_sqrt = gpflow.Parameter(new_q_sqrt, transform=gpflow.utilities.triangular())
 
     def optimize(self, dataset: Dataset) -> None:
         """
@@ -437,30 +495,31 @@ class VariationalGaussianProcess(GPflowPredictor, TrainableProbabilisticModel):
         """
         model = self.model
 
-        if self._use_natgrads:  # optimize variational params with natgrad optimizer
+        with self._device_scope():
+            if self._use_natgrads:  # optimize variational params with natgrad optimizer
 
-            natgrad_optimizer = gpflow.optimizers.NaturalGradient(gamma=self._natgrad_gamma)
-            base_optimizer = self.optimizer
+                natgrad_optimizer = gpflow.optimizers.NaturalGradient(gamma=self._natgrad_gamma)
+                base_optimizer = self.optimizer
 
-            gpflow.set_trainable(model.q_mu, False)  # variational params optimized by natgrad
-            gpflow.set_trainable(model.q_sqrt, False)
-            variational_params = [(model.q_mu, model.q_sqrt)]
-            model_params = model.trainable_variables
+                gpflow.set_trainable(model.q_mu, False)  # variational params optimized by natgrad
+                gpflow.set_trainable(model.q_sqrt, False)
+                variational_params = [(model.q_mu, model.q_sqrt)]
+                model_params = model.trainable_variables
 
-            loss_fn = base_optimizer.create_loss(model, dataset)
+                loss_fn = base_optimizer.create_loss(model, dataset)
 
-            @jit(apply=self.optimizer.compile)
-            def perform_optimization_step() -> None:  # alternate with natgrad optimizations
-                natgrad_optimizer.minimize(loss_fn, variational_params)
-                base_optimizer.optimizer.minimize(
-                    loss_fn, model_params, **base_optimizer.minimize_args
-                )
+                @jit(apply=self.optimizer.compile)
+                def perform_optimization_step() -> None:  # alternate with natgrad optimizations
+                    natgrad_optimizer.minimize(loss_fn, variational_params)
+                    base_optimizer.optimizer.minimize(
+                        loss_fn, model_params, **base_optimizer.minimize_args
+                    )
 
-            for _ in range(base_optimizer.max_iter):  # type: ignore
-                perform_optimization_step()
+                for _ in range(base_optimizer.max_iter):  # type: ignore
+                    perform_optimization_step()
 
-            gpflow.set_trainable(model.q_mu, True)  # revert varitional params to trainable
-            gpflow.set_trainable(model.q_sqrt, True)
+                gpflow.set_trainable(model.q_mu, True)  # revert varitional params to trainable
+                gpflow.set_trainable(model.q_sqrt, True)
 
-        else:
-            self.optimizer.optimize(model, dataset)
+            else:
+                self.optimizer.optimize(model, dataset)
@@ -25,6 +25,13 @@ from ..config import ModelConfig
 from ..interfaces import TrainableProbabilisticModel
 from .models import DeepGaussianProcess
 
+_SUPPORTED_MODELS: dict[
+    Any, Callable[[Any, tf.optimizers.Optimizer], TrainableProbabilisticModel]
+] = {
+    DeepGP: DeepGaussianProcess,
+}
+""" The GPflux model types supported by :class:`GPfluxModelConfig`, and their wrappers. """
+
 
 @dataclass(frozen=True)
 class GPfluxModelConfig(ModelConfig):
@@ -37,12 +44,7 @@ class GPfluxModelConfig(ModelConfig):
     def supported_models(
         self,
     ) -> dict[Any, Callable[[Any, tf.optimizers.Optimizer], TrainableProbabilisticModel]]:
-        models_mapping: dict[
-            Any, Callable[[Any, tf.optimizers.Optimizer], TrainableProbabilisticModel]
-        ] = {
-            DeepGP: DeepGaussianProcess,
-        }
-        return models_mapping
+        return _SUPPORTED_MODELS
 
     def create_optimizer(self) -> tf.optimizers.Optimizer:
         return self.optimizer
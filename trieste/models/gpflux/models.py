@@ -42,6 +42,7 @@ class DeepGaussianProcess(GPfluxPredictor, TrainableProbabilisticModel):
         model: DeepGP,
         optimizer: tf.optimizers.Optimizer | None = None,
         fit_args: Dict[str, Any] | None = None,
+        compile_args: Dict[str, Any] | None = None,
     ):
         """
         :param model: The underlying GPflux deep Gaussian process model.
@@ -53,6 +54,11 @@ class DeepGaussianProcess(GPfluxPredictor, TrainableProbabilisticModel):
             using 100 epochs, batch size 100, and verbose 0. See
             https://keras.io/api/models/model_training_apis/#fit-method for a list of possible
             arguments.
+        :param compile_args: A dictionary of additional arguments to be used in the Keras `compile`
+            method, for example `steps_per_execution`, or `jit_compile` on TensorFlow versions that
+            support XLA compilation of the training step. Defaults to no additional arguments. See
+            https://keras.io/api/models/model_training_apis/#compile-method for a list of possible
+            arguments.
         """
 
         super().__init__(optimizer)
@@ -80,7 +86,7 @@ class DeepGaussianProcess(GPfluxPredictor, TrainableProbabilisticModel):
         self._model_gpflux = model
 
         self._model_keras = model.as_training_model()
-        self._model_keras.compile(self._optimizer)
+        self._model_keras.compile(self._optimizer, **(compile_args or {}))
 
     def __repr__(self) -> str:
         """"""
@@ -107,13 +113,10 @@ class DeepGaussianProcess(GPfluxPredictor, TrainableProbabilisticModel):
     def update(self, dataset: Dataset) -> None:
         inputs = dataset.query_points
         new_num_data = inputs.shape[0]
-        self.model_gpflux.num_data = new_num_data
 
-        # Update num_data for each layer, as well as make sure dataset shapes are ok
+        # Make sure dataset shapes are ok before changing any state, so that a failed update leaves
+        # the model as it was
         for i, layer in enumerate(self.model_gpflux.f_layers):
-            if hasattr(layer, "num_data"):
-                layer.num_data = new_num_data
-
             if isinstance(layer, LatentVariableLayer):
                 inputs = layer(inputs)
                 continue
@@ -141,14 +144,36 @@ class DeepGaussianProcess(GPfluxPredictor, TrainableProbabilisticModel):
 
             inputs = layer(inputs)
 
+        self.model_gpflux.num_data = new_num_data
+        for layer in self.model_gpflux.f_layers:
+            if hasattr(layer, "num_data"):
+                layer.num_data = new_num_data
+
     def optimize(self, dataset: Dataset) -> None:
         """
-        Optimize the model with the specified `dataset`.
+        Optimize the model with the specified `dataset`. The data is fed to Keras as a shuffled,
+        batched and prefetched :class:`tf.data.Dataset`, using the `batch_size` and `shuffle`
+        entries of `fit_args` (with the Keras defaults of 32 and `True`). If `fit_args` contains a
+        `validation_split`, which Keras doesn't support for :class:`tf.data.Dataset` inputs, the
+        data is instead passed to Keras as tensors.
+
         :param dataset: The data with which to optimize the `model`.
         """
-        self.model_keras.fit(
-            {"inputs": dataset.query_points, "targets": dataset.observations}, **self.fit_args
-        )
+        inputs = {"inputs": dataset.query_points, "targets": dataset.observations}
+
+        if "validation_split" in self.fit_args:
+            self.model_keras.fit(inputs, **self.fit_args)
+        else:
+            fit_args = dict(self.fit_args)
+            batch_size = fit_args.pop("batch_size", 32)
+            shuffle = fit_args.pop("shuffle", True)
+
+            data = tf.data.Dataset.from_tensor_slices(inputs)
+            if shuffle:
+                data = data.shuffle(len(dataset), reshuffle_each_iteration=True)
+            data = data.batch(batch_size).prefetch(tf.data.experimental.AUTOTUNE)
+
+            self.model_keras.fit(data, **fit_args)
 
         # Reset lr in case there was an lr schedule: a schedule will have change the learning rate,
         # so that the next time we call `optimize` the starting learning rate would be different.
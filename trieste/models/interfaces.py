@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from itertools import accumulate
 
 import gpflow
 import tensorflow as tf
@@ -160,6 +161,13 @@ class ModelStack(TrainableProbabilisticModel):
         """
         super().__init__()
         self._models, self._event_sizes = zip(*(model_with_event_size,) + models_with_event_sizes)
+        # the slice of each model's outputs along the event axis. These are kept as Python slices
+        # rather than tensors, so that slicing observations is a static strided slice with a
+        # known output shape
+        event_offsets = tuple(accumulate((0,) + self._event_sizes))
+        self._event_slices = tuple(
+            slice(start, end) for start, end in zip(event_offsets[:-1], event_offsets[1:])
+        )
 
     def predict(self, query_points: TensorType) -> tuple[TensorType, TensorType]:
         r"""
@@ -169,6 +177,11 @@ class ModelStack(TrainableProbabilisticModel):
             distributions with event shapes [:math:`E_i`], the mean and variance will both have
             shape [..., :math:`\sum_i E_i`].
         """
+        # The wrapped models are called one after another. Acquisition functions usually call this
+        # from within a tf.function, where these calls are traced into a single graph anyway, and
+        # whose executor is then free to run the independent model computations concurrently.
+        # We don't try to vectorize over the wrapped models, as they are arbitrary models, with no
+        # common parametrization to stack.
         means, vars_ = zip(*[model.predict(query_points) for model in self._models])
         return tf.concat(means, axis=-1), tf.concat(vars_, axis=-1)
 
@@ -215,9 +228,7 @@ class ModelStack(TrainableProbabilisticModel):
 
         :param dataset: The query points and observations for *all* the wrapped models.
         """
-        observations = tf.split(dataset.observations, self._event_sizes, axis=-1)
-
-        for model, obs in zip(self._models, observations):
+        for model, obs in zip(self._models, self._split_observations(dataset.observations)):
             model.update(Dataset(dataset.query_points, obs))
 
     def optimize(self, dataset: Dataset) -> None:
@@ -228,11 +239,17 @@ class ModelStack(TrainableProbabilisticModel):
 
         :param dataset: The query points and observations for *all* the wrapped models.
         """
-        observations = tf.split(dataset.observations, self._event_sizes, axis=-1)
-
-        for model, obs in zip(self._models, observations):
+        for model, obs in zip(self._models, self._split_observations(dataset.observations)):
             model.optimize(Dataset(dataset.query_points, obs))
 
+    def _split_observations(self, observations: TensorType) -> list[TensorType]:
+        """
+        :param observations: Observations for all the wrapped models, of shape [..., E].
+        :return: The observations for each wrapped model, sliced along the event axis according to
+            the event sizes specified at :meth:`__init__`.
+        """
+        return [observations[..., event_slice] for event_slice in self._event_slices]
+
     def log(self) -> None:
         """
         Log model-specific information at a given optimization step.